@@ -1,15 +1,11 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-import base64
-import matplotlib.pyplot as plt
-from io import BytesIO
+
+from dashboard_core import charts, figures, layout
+from dashboard_core.warmup import warm_up
 
 st.set_page_config(page_title="🎓 Education Dashboard - Ivan Nfinda", layout="wide")
+layout.profiling_panel()
 
 # Dark mode toggle
 dark_mode = st.sidebar.toggle("🌙 Dark Mode", value=False)
@@ -43,100 +39,39 @@ def add_custom_css(dark):
 add_custom_css(dark_mode)
 
 # Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv("Statistics_Undergraduate_Programs_Ankara.csv")
-    df["GPA_Numeric"] = df["GPA"].map({
-        "2.00 or below": 1.75,
-        "2.01 - 2.50": 2.25,
-        "2.51 - 3.00": 2.75,
-        "3.01 - 3.50": 3.25,
-        "3.51 - 4.00": 3.75
-    })
-    return df
-
-df = load_data()
+source = layout.data_source("Statistics_Undergraduate_Programs_Ankara.csv")
 
 # Sidebar filters
-st.sidebar.header("🎛️ Filters")
-univ = st.sidebar.multiselect("University", df["University"].unique(), default=df["University"].unique())
-gender = st.sidebar.multiselect("Gender", df["Gender"].unique(), default=df["Gender"].unique())
-year = st.sidebar.multiselect("Year of Study", df["Year of Study"].unique(), default=df["Year of Study"].unique())
-
-filtered_df = df[
-    df["University"].isin(univ) &
-    df["Gender"].isin(gender) &
-    df["Year of Study"].isin(year)
-]
+survey, selection, view = layout.sidebar_filters(source)
+fig_key = figures.data_key(view, selection)
 
 # Header
 st.title("📊 Comprehensive Student Analysis in Ankara")
 st.markdown("**Dive into student data and uncover insights!**")
 
 # KPIs
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("👨‍🎓 Total Students", len(filtered_df))
-col2.metric("🏫 Universities", filtered_df["University"].nunique())
-col3.metric("🎯 Average GPA", round(filtered_df["GPA_Numeric"].mean(), 2) if not filtered_df.empty else 0)
-col4.metric("🤖 AI Knowledge", filtered_df["AI and Automation Knowledge Level"].mode()[0] if not filtered_df.empty else "N/A")
+layout.kpi_row(survey, selection)
+
+warm_up("clustering")
 
 # Animated Chart
 st.subheader("📽️ Animated Gender Distribution by Year")
-animated_fig = px.histogram(filtered_df, x="Gender", animation_frame="Year of Study", color="Gender", barmode="group")
-st.plotly_chart(animated_fig, use_container_width=True)
+animated_fig = figures.cached_figure(fig_key, charts.animated_count_bar, survey.cube, selection=selection,
+                                     x="Gender", frame="Year of Study", color="Gender", barmode="group")
+layout.plotly_chart(animated_fig)
 
 # Clustering Section
 st.subheader("🧠 Student Clustering (GPA & AI Knowledge)")
-if not filtered_df.empty:
-    clustering_df = filtered_df[["GPA_Numeric"]].copy()
-    clustering_df["AI_Knowledge"] = filtered_df["AI and Automation Knowledge Level"].astype("category").cat.codes
-
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(clustering_df)
-
-    kmeans = KMeans(n_clusters=3, random_state=42)
-    clustering_df["Cluster"] = kmeans.fit_predict(X_scaled)
-
-    pca = PCA(n_components=2)
-    components = pca.fit_transform(X_scaled)
-    clustering_df["PC1"], clustering_df["PC2"] = components[:,0], components[:,1]
-
-    cluster_fig = px.scatter(clustering_df, x="PC1", y="PC2", color=clustering_df["Cluster"].astype(str), title="Cluster Visualization")
-    st.plotly_chart(cluster_fig, use_container_width=True)
-
-    # Résumé automatique
-    st.markdown("📋 **Cluster Summary**")
-    for cluster in sorted(clustering_df["Cluster"].unique()):
-        count = (clustering_df["Cluster"] == cluster).sum()
-        avg_gpa = clustering_df[clustering_df["Cluster"] == cluster]["GPA_Numeric"].mean()
-        avg_ai = clustering_df[clustering_df["Cluster"] == cluster]["AI_Knowledge"].mean()
-        st.write(f"🔹 Cluster {cluster}: {count} students | Avg GPA: {round(avg_gpa,2)} | Avg AI Knowledge (encoded): {round(avg_ai,2)}")
+layout.cluster_section(view, "📋 **Cluster Summary**", title="Cluster Visualization",
+                       ai_label="Avg AI Knowledge (encoded)")
 
 # Export options
 st.subheader("📤 Export Data")
-def convert_df(df):
-    return df.to_csv(index=False).encode("utf-8")
-
-csv = convert_df(filtered_df)
-st.download_button("⬇️ Download CSV", csv, "filtered_data.csv", "text/csv")
-
-# Export as PDF (basic with table only)
-def create_pdf_download_link(df):
-    buffer = BytesIO()
-    fig, ax = plt.subplots(figsize=(8, len(df)/3))
-    ax.axis("off")
-    table = ax.table(cellText=df.values, colLabels=df.columns, loc='center', cellLoc='left')
-    plt.tight_layout()
-    plt.savefig(buffer, format="pdf")
-    buffer.seek(0)
-    b64 = base64.b64encode(buffer.read()).decode()
-    return f'<a href="data:application/pdf;base64,{b64}" download="filtered_data.pdf">⬇️ Download PDF</a>'
-
-st.markdown(create_pdf_download_link(filtered_df), unsafe_allow_html=True)
+layout.export_buttons(view)
 
 # Raw Data Table
 st.subheader("🔍 Raw Data")
-st.dataframe(filtered_df)
+layout.raw_data(view)
 
 st.markdown("---")
 st.markdown("💡 **Built with love by Ivan Nfinda | Last updated: May 2025**", unsafe_allow_html=True)
@@ -1,9 +1,10 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from dashboard_core import GPA_POINTS, charts, figures, layout
 
 st.set_page_config(page_title="🎓 Education Dashboard - Ivan Nfinda", layout="wide")
+layout.profiling_panel()
 
 # Custom CSS
 def add_custom_css():
@@ -26,69 +27,48 @@ def add_custom_css():
 add_custom_css()
 
 # Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv("Statistics_Undergraduate_Programs_Ankara.csv")
-    df["GPA_Numeric"] = df["GPA"].map({
-        "2.00 or below": 1.75,
-        "2.01 - 2.50": 2.25,
-        "2.51 - 3.00": 2.75,
-        "3.01 - 3.50": 3.25,
-        "3.51 - 4.00": 3.75
-    })
-    return df
-
-df = load_data()
+source = layout.data_source("Statistics_Undergraduate_Programs_Ankara.csv")
 
 # Sidebar filters
-st.sidebar.header("🎛️ Filters")
-univ = st.sidebar.multiselect("University", df["University"].unique(), default=df["University"].unique())
-gender = st.sidebar.multiselect("Gender", df["Gender"].unique(), default=df["Gender"].unique())
-year = st.sidebar.multiselect("Year of Study", df["Year of Study"].unique(), default=df["Year of Study"].unique())
-
-filtered_df = df[
-    df["University"].isin(univ) &
-    df["Gender"].isin(gender) &
-    df["Year of Study"].isin(year)
-]
+survey, selection, view = layout.sidebar_filters(source)
+fig_key = figures.data_key(view, selection)
 
 # Header
 st.title("📊 Comprehensive Student Analysis in Ankara")
 st.markdown("**Dive into student data and uncover insights!**")
 
 # KPIs
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("👨‍🎓 Total Students", len(filtered_df))
-col2.metric("🏫 Universities", filtered_df["University"].nunique())
-col3.metric("🎯 Average GPA", round(filtered_df["GPA_Numeric"].mean(), 2) if not filtered_df.empty else 0)
-col4.metric("🤖 AI Knowledge", filtered_df["AI and Automation Knowledge Level"].mode()[0] if not filtered_df.empty else "N/A")
+layout.kpi_row(survey, selection)
 
 # Charts
 st.subheader("📌 Demographic Distribution")
 col1, col2 = st.columns(2)
 
 with col1:
-    fig1 = px.pie(filtered_df, names="Gender", title="Gender")
-    st.plotly_chart(fig1, use_container_width=True)
+    fig1 = figures.cached_figure(fig_key, charts.count_pie, survey.cube, "Gender", selection, title="Gender")
+    layout.plotly_chart(fig1)
 
 with col2:
-    fig2 = px.histogram(filtered_df, x="Year of Study", color="University", title="Years of Study by University")
-    st.plotly_chart(fig2, use_container_width=True)
+    fig2 = figures.cached_figure(fig_key, charts.count_bar, survey.cube, "Year of Study", "University", selection,
+                                 title="Years of Study by University")
+    layout.plotly_chart(fig2)
 
 st.subheader("📚 GPA and AI Knowledge")
 col1, col2 = st.columns(2)
 
 with col1:
-    fig3 = px.box(filtered_df, x="University", y="GPA_Numeric", title="GPA Distribution by University")
-    st.plotly_chart(fig3, use_container_width=True)
+    fig3 = figures.cached_figure(fig_key, charts.quartile_box, survey.cube, "GPA", "University", GPA_POINTS,
+                                 selection, y="GPA_Numeric", title="GPA Distribution by University")
+    layout.plotly_chart(fig3)
 
 with col2:
-    fig4 = px.histogram(filtered_df, x="AI and Automation Knowledge Level", color="Gender", title="AI Knowledge by Gender")
-    st.plotly_chart(fig4, use_container_width=True)
+    fig4 = figures.cached_figure(fig_key, charts.count_bar, survey.cube, "AI and Automation Knowledge Level", "Gender",
+                                 selection, title="AI Knowledge by Gender")
+    layout.plotly_chart(fig4)
 
 # Data table
 st.subheader("🔍 Raw Data")
-st.dataframe(filtered_df)
+layout.raw_data(view)
 
 st.markdown("---")
 st.markdown("💡 **Built with love by Ivan Nfinda | Last updated: May 2025**", unsafe_allow_html=True)
@@ -0,0 +1,52 @@
+"""Figure JSON size and build time: per-respondent figures vs cube roll-ups.
+
+    python -m benchmarks.bench_chart_payload [n_rows ...]
+"""
+
+import sys
+
+import plotly.express as px
+
+from dashboard_core import SurveyCube, charts
+
+from .common import fmt_size, print_table, tiled_survey, timed
+
+AI = "AI and Automation Knowledge Level"
+
+
+def row_level(df):
+    return [
+        px.bar(df, x="University", y="GPA_Numeric", color="Gender"),
+        px.bar(df, x=AI, color="Gender"),
+        px.histogram(df, x="Year of Study", color="University"),
+        px.histogram(df, x="Gender", animation_frame="Year of Study", color="Gender", barmode="group"),
+    ]
+
+
+def aggregated(cube):
+    return [
+        charts.mean_gpa_bar(cube),
+        charts.count_bar(cube, AI, "Gender", order_by_count=True),
+        charts.count_bar(cube, "Year of Study", "University"),
+        charts.animated_count_bar(cube, x="Gender", frame="Year of Study", color="Gender", barmode="group"),
+    ]
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        t_old, figs_old = timed(row_level, df, repeat=1)
+        t_cube, cube = timed(SurveyCube.from_frame, df, repeat=1)
+        t_new, figs_new = timed(aggregated, cube)
+        rows.append((
+            n,
+            fmt_size(sum(len(f.to_json()) for f in figs_old)), f"{t_old * 1000:.0f}ms",
+            fmt_size(sum(len(f.to_json()) for f in figs_new)), f"{t_new * 1000:.0f}ms",
+            f"{t_cube * 1000:.0f}ms",
+        ))
+    print_table(rows, ["rows", "row json", "row build", "agg json", "agg build", "cube (once)"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000])
@@ -0,0 +1,110 @@
+"""Peak memory of the chunked filter -> aggregate path, with a ceiling check.
+
+Each measurement runs in its own interpreter.  A sampler thread records
+how far the resident set size rose above its level after imports.  This
+figure includes the CSV parser's buffers, which tracemalloc does not
+see.  The chunked run must stay under ``MEMORY_CEILING_MB`` whatever the
+number of rows, and must produce the same KPIs and roll-ups as the
+in-memory path.  The script exits with status 1 otherwise.
+
+    python -m benchmarks.bench_chunked [n_rows ...]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from .common import print_table, tiled_survey
+
+BATCH_ROWS = 50_000
+MEMORY_CEILING_MB = 64
+SELECTION = {"Gender": ["Female"], "Year of Study": ["2", "3", "4"]}
+
+
+def _rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class PeakRSS:
+    """Highest RSS seen while the block runs, sampled every few milliseconds (Linux only)."""
+
+    def __enter__(self):
+        self.base = self.peak = _rss_mb()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._done.wait(0.002):
+            self.peak = max(self.peak, _rss_mb())
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_mb())
+        self.growth = self.peak - self.base
+
+
+def measure(mode, path):
+    """Runs in the child: aggregate ``path`` in memory or in chunks, print peak growth and results."""
+    from dashboard_core import SurveyCube, chunked
+    from dashboard_core.store import parse_csv
+
+    start = time.perf_counter()
+    with PeakRSS() as rss:
+        if mode == "memory":
+            frame = parse_csv(path)
+            frame = frame[chunked.batch_mask(frame, SELECTION)]
+            cube = SurveyCube.from_frame(frame)
+        else:
+            cube = chunked.aggregate(path, SELECTION, batch_rows=BATCH_ROWS)
+    elapsed = time.perf_counter() - start
+    rollup = cube.rollup(["University", "Gender"])
+    print(json.dumps({
+        "peak_mb": rss.growth,
+        "seconds": elapsed,
+        "kpis": cube.kpis(),
+        "rollup": rollup[["count", "gpa_n"]].to_numpy().tolist(),
+    }))
+
+
+def run(mode, path):
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bench_chunked", "--measure", mode, path],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main(sizes):
+    rows, failed = [], False
+    for n in sizes:
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "survey.csv")
+            tiled_survey(n).drop(columns="GPA_Numeric").to_csv(path, index=False)
+            memory, chunks = run("memory", path), run("chunked", path)
+            same = memory["kpis"] == chunks["kpis"] and memory["rollup"] == chunks["rollup"]
+            ok = same and chunks["peak_mb"] < MEMORY_CEILING_MB
+            failed |= not ok
+            rows.append((n, f"{os.path.getsize(path) / 2**20:.0f}MB",
+                         f"{memory['peak_mb']:.0f}MB / {memory['seconds']:.2f}s",
+                         f"{chunks['peak_mb']:.0f}MB / {chunks['seconds']:.2f}s",
+                         "yes" if same else "NO", "ok" if ok else "FAIL"))
+        finally:
+            shutil.rmtree(tmp)
+    print(f"batches of {BATCH_ROWS} rows, ceiling {MEMORY_CEILING_MB}MB, selection {SELECTION}")
+    print_table(rows, ["rows", "csv", "in memory", "chunked", "same result", "ceiling"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        measure(*sys.argv[2:4])
+    else:
+        sys.exit(main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000, 4_000_000]))
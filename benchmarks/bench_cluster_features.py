@@ -0,0 +1,38 @@
+"""Clustering fit time versus number of features and rows, per engine.
+
+The Likert matrix is encoded once per size, as the store does at load
+time, and every fit reads its first ``features`` columns from it.
+"matrix" is the size of the int8 codes being clustered, next to what the
+same columns cost as a float64 frame.
+
+    python -m benchmarks.bench_cluster_features [n_rows ...]
+"""
+
+import sys
+
+from dashboard_core import LIKERT_SCHEMA, encode_likert
+from dashboard_core.clustering import fit_clusters, fit_clusters_streaming, fit_clusters_weighted
+
+from .common import fmt_size, print_table, tiled_survey, timed
+
+FEATURE_COUNTS = [2, 4, 8, 16]
+ENGINES = {"full": fit_clusters, "streaming": fit_clusters_streaming, "weighted": fit_clusters_weighted}
+
+
+def main(sizes):
+    fit_clusters(tiled_survey(100))  # imports scikit-learn outside the timings
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        t_encode, likert = timed(encode_likert, df, repeat=1)
+        for k in FEATURE_COUNTS:
+            features = tuple(LIKERT_SCHEMA)[:k]
+            times = [timed(fit, df, likert=likert, features=features, repeat=1)[0] for fit in ENGINES.values()]
+            rows.append((n, k, f"{fmt_size(n * k)} / {fmt_size(n * k * 8)}",
+                         *(f"{t:.2f}s" for t in times)))
+        print(f"{n} rows: Likert matrix encoded once in {t_encode * 1000:.0f}ms")
+    print_table(rows, ["rows", "features", "matrix int8 / float64", *ENGINES])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
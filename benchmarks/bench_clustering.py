@@ -0,0 +1,41 @@
+"""Full-batch vs streaming vs weighted clustering: wall time and inertia.
+
+"ARI" is the adjusted Rand index of the weighted labels against the full
+engine's (1 = the same partition, whatever the cluster ids).
+
+    python -m benchmarks.bench_clustering [n_rows ...]
+"""
+
+import sys
+
+from sklearn.metrics import adjusted_rand_score
+
+from dashboard_core.clustering import fit_clusters, fit_clusters_streaming, fit_clusters_weighted
+
+from .common import print_table, tiled_survey, timed
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        t_full, full = timed(fit_clusters, df, repeat=1)
+        t_stream, stream = timed(fit_clusters_streaming, df, repeat=1)
+        # warm start as after a small filter change: centroids of a 95% subset
+        previous = fit_clusters_streaming(df.iloc[: int(n * 0.95)])
+        t_warm, warm = timed(fit_clusters_streaming, df, init_centers=previous.centers, repeat=1)
+        t_weighted, weighted = timed(fit_clusters_weighted, df, repeat=1)
+        agreement = adjusted_rand_score(full.data["Cluster"], weighted.data["Cluster"])
+        rows.append((
+            n,
+            f"{t_full:.2f}s", f"{full.inertia:.4g}",
+            f"{t_stream:.2f}s", f"{stream.inertia:.4g}",
+            f"{t_warm:.2f}s", f"{warm.inertia:.4g}",
+            f"{t_weighted:.2f}s", f"{weighted.inertia:.4g}", f"{agreement:.3f}",
+        ))
+    print_table(rows, ["rows", "full", "inertia", "streaming", "inertia", "warm", "inertia",
+                       "weighted", "inertia", "ARI"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,50 @@
+"""Time to produce the dashboard's row-level figures: rebuilt, re-skinned, or returned as is.
+
+"rebuild" runs Plotly Express over the rows like every rerun used to,
+"theme switch" re-skins the cached traces with the other template, and
+"same selection" is a rerun where nothing the figures depend on changed.
+
+    python -m benchmarks.bench_figures [n_rows ...]
+"""
+
+import sys
+
+import plotly.express as px
+
+from dashboard_core import figures
+from dashboard_core.cache import LRUCache
+
+from .common import print_table, tiled_survey, timed
+
+FIGURES = [
+    (px.histogram, dict(x="Gender", animation_frame="Year of Study", color="Gender", barmode="group")),
+    (px.violin, dict(y="GPA_Numeric", x="Year of Study", color="Gender", box=True)),
+    (px.scatter, dict(x="GPA_Numeric", y="Year of Study", color="Gender")),
+]
+
+
+def draw(df, template, traces, skinned):
+    return [figures.cached_figure(f"bench-{len(df)}", build, df, template=template, traces=traces, figures=skinned,
+                                  **kwargs)
+            for build, kwargs in FIGURES]
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        t_build, _ = timed(lambda: [build(df, template="plotly_white", **kwargs) for build, kwargs in FIGURES],
+                           repeat=1)
+        traces = LRUCache()
+        draw(df, "plotly_white", traces, LRUCache())
+        t_skin, _ = timed(lambda: draw(df, "plotly_dark", traces, LRUCache()))
+        skinned = LRUCache()
+        draw(df, "plotly_dark", traces, skinned)
+        t_hit, _ = timed(draw, df, "plotly_dark", traces, skinned)
+        rows.append((n, f"{t_build * 1000:.0f}ms", f"{t_skin * 1000:.0f}ms", f"{t_hit * 1000:.2f}ms"))
+    print(f"{len(FIGURES)} figures: animated histogram, violin, scatter")
+    print_table(rows, ["rows", "rebuild", "theme switch", "same selection"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
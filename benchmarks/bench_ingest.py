@@ -0,0 +1,52 @@
+"""Time to pick up a batch of new responses: full reparse vs incremental append.
+
+    python -m benchmarks.bench_ingest [n_rows ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from dashboard_core import store
+from dashboard_core.cache import LRUCache
+
+from .common import print_table, tiled_survey
+
+BATCH_ROWS = 100
+
+
+def main(sizes):
+    # cubes left on disk by earlier runs would hide the build being measured
+    store.cube_cache = LRUCache(maxsize=0)
+    rows = []
+    for n in sizes:
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "survey.csv")
+            df = tiled_survey(n).drop(columns="GPA_Numeric")
+            df.to_csv(path, index=False)
+            batch = df.sample(BATCH_ROWS, random_state=0)
+
+            start = time.perf_counter()
+            survey = store.open_survey(path)
+            survey.index, survey.cube
+            t_full = time.perf_counter() - start
+
+            store.append_responses(batch, path)
+            start = time.perf_counter()
+            survey = store.open_survey(path)
+            survey.index, survey.cube
+            t_append = time.perf_counter() - start
+            assert len(survey) == n + BATCH_ROWS
+            rows.append((n, f"{t_full:.3f}s", f"{t_append:.3f}s", f"{t_full / t_append:.0f}x"))
+        finally:
+            store._stores.clear()
+            shutil.rmtree(tmp)
+    print(f"batch of {BATCH_ROWS} rows, index and cube built")
+    print_table(rows, ["rows", "full parse", "append", "speedup"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
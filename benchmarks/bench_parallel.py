@@ -0,0 +1,58 @@
+"""Scaling of the process-pool cube build with the number of workers.
+
+The column buffers are exported once and the pool is warmed up with one
+build before the reductions over the workers are timed; the last column
+is a whole ``build_cube``, export included.
+Each build must give the same KPIs and roll-ups as
+``SurveyCube.from_frame``.  Worker counts double up to ``SURVEY_WORKERS``
+(default: the CPU count).
+
+    python -m benchmarks.bench_parallel [n_rows ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from dashboard_core import SurveyCube, parallel
+
+from .common import print_table, tiled_survey, timed
+
+
+def worker_counts():
+    cpus = parallel.default_workers()
+    counts, n = [], 1
+    while n < cpus:
+        counts.append(n)
+        n *= 2
+    return counts + [cpus]
+
+
+def same(a, b):
+    dims = ["University", "Year of Study", "Gender"]
+    return a.kpis() == b.kpis() and a.rollup(dims)[["count", "gpa_n"]].equals(b.rollup(dims)[["count", "gpa_n"]])
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        serial, expected = timed(SurveyCube.from_frame, df)
+        rows.append((n, "from_frame", f"{serial:.3f}s", "1.00x", "yes", ""))
+        directory = parallel.export_columns(df, tempfile.mkdtemp())
+        try:
+            for workers in worker_counts():
+                parallel.cube_of_columns(directory, n, workers=workers)
+                t, cube = timed(parallel.cube_of_columns, directory, n, workers=workers)
+                total, _ = timed(parallel.build_cube, df, workers=workers, repeat=1)
+                rows.append((n, f"{workers} workers", f"{t:.3f}s", f"{serial / t:.2f}x",
+                             "yes" if same(cube, expected) else "NO", f"{total:.3f}s"))
+        finally:
+            shutil.rmtree(directory)
+    print(f"{os.cpu_count()} CPUs")
+    print_table(rows, ["rows", "build", "time", "speedup", "same result", "with export"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000_000, 4_000_000])
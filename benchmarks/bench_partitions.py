@@ -0,0 +1,41 @@
+"""Load time and files opened for a partitioned dataset, with and without pruning.
+
+    python -m benchmarks.bench_partitions [n_rows ...]
+"""
+
+import shutil
+import sys
+import tempfile
+
+from dashboard_core import dataset
+from dashboard_core.cache import LRUCache
+
+from .common import print_table, tiled_survey, timed
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        root = tempfile.mkdtemp()
+        try:
+            df = tiled_survey(n)
+            dataset.write_partitioned(df, root)
+            ds = dataset.SurveyDataset(root, cache=LRUCache(maxsize=0))
+            selections = {
+                "everything": {},
+                "1 university": {"University": ds.values("University")[:1]},
+                "1 university, 1 year": {"University": ds.values("University")[:1],
+                                         "Year of Study": ds.values("Year of Study")[:1]},
+            }
+            for name, selection in selections.items():
+                # first call fills the per-file Arrow caches, the best of the next ones is reported
+                ds.load(selection).frame
+                t, frame = timed(lambda: ds.load(selection).frame)
+                rows.append((n, name, f"{len(ds.files(selection))}/{len(ds.files({}))}", len(frame), f"{t:.3f}s"))
+        finally:
+            shutil.rmtree(root)
+    print_table(rows, ["rows", "selection", "files opened", "rows loaded", "load"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
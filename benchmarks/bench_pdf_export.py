@@ -0,0 +1,63 @@
+"""Paginated PDF export vs the original single-figure matplotlib table.
+
+    python -m benchmarks.bench_pdf_export [n_rows ...]
+
+The matplotlib path is only run up to LEGACY_MAX_ROWS rows: its figure
+height grows with the row count and it already takes tens of seconds at
+a few hundred rows, and skipped when matplotlib, no longer a requirement
+of the dashboard, is not installed.
+"""
+
+import sys
+import time
+import tracemalloc
+from importlib.util import find_spec
+from io import BytesIO
+
+from dashboard_core.export import pdf_bytes
+
+from .common import fmt_size, print_table, tiled_survey
+
+LEGACY_MAX_ROWS = 200
+
+
+def legacy_pdf(df):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    buf = BytesIO()
+    fig, ax = plt.subplots(figsize=(8, len(df) / 3))
+    ax.axis("off")
+    ax.table(cellText=df.values, colLabels=df.columns, loc='center', cellLoc='left')
+    plt.tight_layout()
+    plt.savefig(buf, format="pdf")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def measure(fn, df):
+    # timed and traced in separate runs: tracemalloc slows allocation-heavy code several-fold
+    start = time.perf_counter()
+    out = fn(df)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(df)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return f"{elapsed:.2f}s", fmt_size(peak), fmt_size(len(out))
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        df = tiled_survey(n)
+        legacy = ("-", "-", "-")
+        if n <= LEGACY_MAX_ROWS and find_spec("matplotlib") is not None:
+            legacy = measure(legacy_pdf, df)
+        rows.append((n, *legacy, *measure(pdf_bytes, df)))
+    print_table(rows, ["rows", "mpl time", "mpl peak", "mpl size", "paged time", "paged peak", "paged size"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [188, 10_000, 100_000])
@@ -0,0 +1,111 @@
+"""One dashboard rerun without a browser, stage by stage, on synthetic surveys.
+
+Each size gets a survey drawn from the answer shares of the bundled CSV
+(``common.synthetic_survey``), written to a temporary CSV, and then goes
+through what a first rerun does with every cache cold:
+
+    load       parse the CSV and write its Arrow cache
+    reload     memory-map the Arrow cache, as later processes do
+    filter     build the filter bitmaps and select half the universities
+    kpis       build the cube and roll up the KPI row
+    charts     build the app's figures and serialize them as Streamlit does
+    cluster    fit the default clustering on the selection
+    export     CSV bytes of the selection
+
+Stages are timed with ``dashboard_core.profiling``, figures and the export
+also on their own.  Time and CPU time come from one pass, peak memory from
+a second pass under tracemalloc, which slows Python-heavy stages down
+several times.  Traced memory counts NumPy and pandas buffers, not
+memory-mapped files.  With ``DASHBOARD_PROFILE_LOG`` set both passes are
+appended there as JSON lines, tagged with the row count, to compare runs
+across commits.
+
+    python -m benchmarks.bench_pipeline [n_rows ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from dashboard_core import charts, clustering, export, figures, profiling, store
+from dashboard_core.cache import LRUCache
+
+from .common import fmt_size, print_table, synthetic_survey
+
+
+def build_figures(survey, view, selection):
+    """The figures of ``app_final_reordered.py``, built without any cache."""
+    frame, cube = view.frame, survey.cube
+    cold = dict(traces=LRUCache(maxsize=0), figures=LRUCache(maxsize=0))
+    return [
+        figures.cached_figure(None, charts.animated_count_bar, cube, selection=selection, x="Gender",
+                              frame="Year of Study", color="Gender", barmode="group", **cold),
+        figures.cached_figure(None, charts.mean_gpa_bar, cube, selection, **cold),
+        figures.cached_figure(None, charts.kde_violin, frame, y="GPA_Numeric", x="Year of Study", color="Gender",
+                              box=True, **cold),
+        figures.cached_figure(None, charts.sampled_scatter, frame, x="GPA_Numeric", y="Year of Study", color="Gender",
+                              strata=["Gender", "Year of Study"], **cold),
+        figures.cached_figure(None, charts.count_bar, cube, "AI and Automation Knowledge Level", "Gender", selection,
+                              order_by_count=True, **cold),
+    ]
+
+
+def run(path, cache_dir):
+    with profiling.section("load"):
+        survey = store.read_survey(path, cache_dir)
+    with profiling.section("reload"):
+        survey = store.read_survey(path, cache_dir)
+    with profiling.section("filter"):
+        universities = survey.index.values("University")
+        selection = {"University": universities[:len(universities) // 2 or 1]}
+        view = survey.select(selection)
+    with profiling.section("kpis"):
+        survey.cube.kpis(selection)
+    with profiling.section("charts"):
+        payload = sum(len(fig.to_json()) for fig in build_figures(survey, view, selection))
+    with profiling.section("cluster"):
+        clustering.cluster_view(view, cache=LRUCache(maxsize=0))
+    with profiling.section("export"):
+        export.view_export(view, "csv", cache=LRUCache(maxsize=0))
+    return len(view), payload
+
+
+def profile(path, n, trace_memory):
+    """Profiler of one cold run over ``path``, with a fresh Arrow cache directory."""
+    cache_dir = tempfile.mkdtemp()
+    try:
+        profiler = profiling.start_run("bench_pipeline", trace_memory=trace_memory)
+        result = run(path, cache_dir)
+    finally:
+        profiling.stop_run()
+        shutil.rmtree(cache_dir)
+    profiling.append_log(profiler, rows=n, traced=trace_memory)
+    return profiler, result
+
+
+def main(sizes):
+    # nothing computed by an earlier size or run may be reused
+    store.cube_cache = LRUCache(maxsize=0)
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "survey.csv")
+        synthetic_survey(100).drop(columns="GPA_Numeric").to_csv(path, index=False)
+        profile(path, 0, trace_memory=False)  # imports Plotly and scikit-learn outside the timings
+        rows = []
+        for n in sizes:
+            synthetic_survey(n).drop(columns="GPA_Numeric").to_csv(path, index=False)
+            timings, (selected, payload) = profile(path, n, trace_memory=False)
+            memory, _ = profile(path, n, trace_memory=True)
+            for t, m in zip(timings.records, memory.records):
+                rows.append((n, "  " * t["depth"] + t["section"], f"{t['wall_ms']:.0f}ms", f"{t['cpu_ms']:.0f}ms",
+                             fmt_size(m["alloc_kb"] * 1024)))
+            rows.append((n, "total", f"{timings.total('wall_ms'):.0f}ms", f"{timings.total('cpu_ms'):.0f}ms", ""))
+            print(f"{n} rows: {selected} selected, {fmt_size(payload)} of figure JSON")
+    finally:
+        shutil.rmtree(tmp)
+    print_table(rows, ["rows", "stage", "time", "cpu", "peak memory"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 100_000, 10_000_000])
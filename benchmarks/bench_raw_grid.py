@@ -0,0 +1,42 @@
+"""Raw-data table payload: every filtered row vs one server-side page.
+
+The payload is the Arrow bytes ``st.dataframe`` sends to the browser.
+"first sort" includes computing the display order, which later pages of
+the same sort reuse.
+
+    python -m benchmarks.bench_raw_grid [n_rows ...]
+"""
+
+import sys
+
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+from dashboard_core import FilterIndex, grid
+from dashboard_core.cache import LRUCache
+
+from .common import fmt_size, print_table, tiled_survey, timed
+
+PAGE_SIZE = 100
+SORT_BY = "University"
+
+
+def payload(frame):
+    return len(convert_pandas_df_to_arrow_bytes(frame))
+
+
+def main(sizes):
+    rows = []
+    for n in sizes:
+        view = FilterIndex(tiled_survey(n), fingerprint=f"bench-{n}").select({})
+        t_full, full = timed(lambda: payload(view.frame), repeat=1)
+        t_page, page = timed(lambda: payload(grid.page(view, 3, PAGE_SIZE)))
+        t_sort, _ = timed(grid.sort_order, view, SORT_BY, cache=LRUCache(maxsize=0), repeat=1)
+        t_next, _ = timed(lambda: payload(grid.page(view, 4, PAGE_SIZE, sort_by=SORT_BY)))
+        rows.append((n, fmt_size(full), f"{t_full * 1000:.0f}ms", fmt_size(page), f"{t_page * 1000:.1f}ms",
+                     f"{t_sort * 1000:.0f}ms", f"{t_next * 1000:.1f}ms"))
+    print(f"all 20 columns, pages of {PAGE_SIZE} rows, sorted by {SORT_BY}")
+    print_table(rows, ["rows", "full table", "serialize", "one page", "serialize", "first sort", "next page"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 100_000, 1_000_000])
@@ -0,0 +1,46 @@
+"""Row-level scatter and violin figures vs their sampled / server-side KDE versions.
+
+Times include serializing the figure, as ``st.plotly_chart`` does; the
+builders fall back to the row-level figure at or below
+``SAMPLE_THRESHOLD`` rows.
+
+    python -m benchmarks.bench_sampled_charts [n_rows ...]
+"""
+
+import sys
+
+import plotly.express as px
+
+from dashboard_core import charts
+
+from .common import fmt_size, print_table, synthetic_survey, timed
+
+VIOLIN = dict(y="GPA_Numeric", x="Year of Study", color="Gender", box=True)
+SCATTER = dict(x="GPA_Numeric", y="Year of Study", color="Gender")
+STRATA = ["Gender", "Year of Study"]
+
+
+def payload(build, *args, **kwargs):
+    return len(build(*args, **kwargs).to_json())
+
+
+def main(sizes):
+    payload(px.violin, synthetic_survey(100), **VIOLIN)  # Plotly's first figure outside the timings
+    rows = []
+    for n in sizes:
+        df = synthetic_survey(n)
+        for name, old, new in [
+            ("violin", lambda: payload(px.violin, df, **VIOLIN), lambda: payload(charts.kde_violin, df, **VIOLIN)),
+            ("scatter", lambda: payload(px.scatter, df, **SCATTER),
+             lambda: payload(charts.sampled_scatter, df, strata=STRATA, **SCATTER)),
+        ]:
+            t_old, size_old = timed(old, repeat=1)
+            t_new, size_new = timed(new, repeat=1)
+            rows.append((n, name, fmt_size(size_old), f"{t_old * 1000:.0f}ms", fmt_size(size_new),
+                         f"{t_new * 1000:.0f}ms"))
+    print(f"sampled above {charts.SAMPLE_THRESHOLD} rows, {charts.SAMPLE_SIZE} points")
+    print_table(rows, ["rows", "chart", "row json", "row build", "sampled json", "sampled build"])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
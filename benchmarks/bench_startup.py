@@ -0,0 +1,78 @@
+"""Import cost per dashboard section, measured with ``python -X importtime``.
+
+Each section is imported in a fresh interpreter after the sections that
+precede it at startup, so its figure is what it adds on top of them.  The
+last table compares a cold start that imports everything up front (the
+original apps) with the current deferred imports.  matplotlib, which only
+the original apps import, is left out when it is not installed.
+
+    python -m benchmarks.bench_startup [repeat]
+"""
+
+import subprocess
+import sys
+import time
+from importlib.util import find_spec
+
+from dashboard_core.warmup import SECTION_MODULES
+
+from .common import print_table
+
+SECTIONS = [
+    ("streamlit", ["streamlit"]),
+    ("plotly", ["plotly.express"]),
+    ("data (store/filters/cube)", ["dashboard_core"]),
+    ("layout (charts/export)", ["dashboard_core.layout", "dashboard_core.warmup"]),
+    ("clustering fit (sklearn)", SECTION_MODULES["clustering"]),
+    ("legacy PDF (matplotlib)", ["matplotlib.pyplot"]),
+]
+
+EAGER = ["streamlit", "pandas", "plotly.express", "sklearn.cluster", "sklearn.decomposition",
+         "sklearn.preprocessing", "matplotlib.pyplot", "dashboard_core.layout"]
+if find_spec("matplotlib") is None:
+    SECTIONS = SECTIONS[:-1]
+    EAGER.remove("matplotlib.pyplot")
+DEFERRED = ["streamlit", "plotly.express", "dashboard_core.layout", "dashboard_core.warmup"]
+MARKER = "--section--"
+
+
+def _imports(modules):
+    return "; ".join(f"import {m}" for m in modules)
+
+
+def section_cost(before, modules):
+    """Microseconds spent importing ``modules`` once ``before`` is loaded, and the number of new modules."""
+    code = (f"{_imports(before)}; import sys; sys.stderr.write('{MARKER}\\n'); sys.stderr.flush(); "
+            f"{_imports(modules)}")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code.lstrip("; ")],
+                          capture_output=True, text=True, check=True)
+    after = proc.stderr.split(MARKER, 1)[1]
+    self_us = [int(line.split("|")[0].split(":")[1]) for line in after.splitlines()
+               if line.startswith("import time:") and "self [us]" not in line]
+    return sum(self_us), len(self_us)
+
+
+def cold_start(modules):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", _imports(modules)], check=True)
+    return time.perf_counter() - start
+
+
+def main(repeat=5):
+    rows, before = [], []
+    for name, modules in SECTIONS:
+        costs = [section_cost(before, modules) for _ in range(repeat)]
+        us, n_modules = min(costs)
+        rows.append((name, f"{us / 1e6:.3f}s", n_modules))
+        before = before + modules
+    print_table(rows, ["section", "import", "modules"])
+    print()
+
+    rows = []
+    for name, modules in [("eager (original)", EAGER), ("deferred", DEFERRED)]:
+        rows.append((name, f"{min(cold_start(modules) for _ in range(repeat)):.2f}s"))
+    print_table(rows, ["startup", "wall time"])
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""Helpers shared by the benchmark scripts (run them from the repo root with ``python -m``)."""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard_core import load_survey
+from dashboard_core.store import add_gpa_numeric
+
+
+def tiled_survey(n_rows):
+    """The bundled survey repeated up to ``n_rows`` rows (categorical dtypes kept)."""
+    base = load_survey()
+    reps = -(-n_rows // len(base))
+    rows = np.tile(np.arange(len(base)), reps)[:n_rows]
+    return base.take(rows).reset_index(drop=True)
+
+
+def synthetic_survey(n_rows, seed=0, source=None):
+    """``n_rows`` random responses with the columns, categories and answer shares of the bundled survey.
+
+    Each column is drawn independently from its distribution in ``source`` (the bundled survey by
+    default), missing answers included, so the marginals match but cross-column patterns do not.
+    """
+    source = load_survey() if source is None else source
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for col in source.columns:
+        if col == "GPA_Numeric":
+            continue
+        values = source[col]
+        # code -1 (missing) is drawn like any other answer
+        codes, counts = np.unique(values.cat.codes.to_numpy(), return_counts=True)
+        drawn = rng.choice(codes.astype(np.int16), size=n_rows, p=counts / counts.sum())
+        columns[col] = pd.Categorical.from_codes(drawn, dtype=values.dtype)
+    return add_gpa_numeric(pd.DataFrame(columns))
+
+
+def timed(fn, *args, repeat=3, **kwargs):
+    """Best wall time of ``repeat`` calls, and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(rows, columns):
+    widths = [max(len(str(c)), *(len(str(r[i])) for r in rows)) for i, c in enumerate(columns)]
+    print("  ".join(str(c).rjust(w) for c, w in zip(columns, widths)))
+    for r in rows:
+        print("  ".join(str(v).rjust(w) for v, w in zip(r, widths)))
+
+
+def fmt_size(n_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n_bytes < 1024 or unit == "GB":
+            return f"{n_bytes:.0f}{unit}" if unit == "B" else f"{n_bytes:.1f}{unit}"
+        n_bytes /= 1024
+
+
+pd.set_option("display.width", 120)
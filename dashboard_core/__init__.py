@@ -0,0 +1,21 @@
+"""Shared data layer for the education dashboard apps."""
+
+from .cube import SurveyCube
+from .filters import FILTER_COLUMNS, FilteredView, FilterIndex
+from .likert import LIKERT_SCHEMA, LikertMatrix, encode_likert
+from .store import GPA_POINTS, SurveyStore, append_responses, load_survey, open_survey
+
+__all__ = [
+    "FILTER_COLUMNS",
+    "FilteredView",
+    "FilterIndex",
+    "GPA_POINTS",
+    "LIKERT_SCHEMA",
+    "LikertMatrix",
+    "SurveyCube",
+    "SurveyStore",
+    "append_responses",
+    "encode_likert",
+    "load_survey",
+    "open_survey",
+]
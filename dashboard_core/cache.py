@@ -0,0 +1,245 @@
+"""Result caches shared by the dashboard reruns.
+
+:class:`LRUCache` lives in one process.  :class:`DiskCache` pickles results
+into a SQLite file in WAL mode, so every Streamlit worker on a host reads
+the others' results and they survive restarts and deploys.  Entries expire
+after ``ttl`` seconds, and the least recently read ones are evicted once
+the file holds more than ``max_bytes``.  :func:`shared_cache` stacks an LRU
+over the disk cache, which is how the package's caches are built; set
+``DASHBOARD_RESULT_CACHE=0`` to keep them in memory only.
+
+Unpickling runs code chosen by whoever wrote the file, so the file lives
+in a private directory, ``.survey_cache/results`` (created with mode
+0700), unless ``SURVEY_RESULT_CACHE`` names another path.  It is only
+opened when both the file and its directory belong to the current user
+and cannot be written by anyone else; otherwise, like any other error of
+the disk cache, every lookup is a miss.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+
+RESULT_CACHE_PATH = os.environ.get("SURVEY_RESULT_CACHE",
+                                   os.path.abspath(os.path.join(".survey_cache", "results", "results.sqlite")))
+# part of every disk key: bump it when a cached class (SurveyCube, ClusterResult...) changes shape
+# or a cached figure builder changes its output
+RESULT_CACHE_VERSION = "3"
+RESULT_TTL = 7 * 24 * 3600
+RESULT_MAX_BYTES = 512 * 2**20
+
+
+class LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry.
+
+    With ``max_bytes``, the ``sizeof`` of the values kept is bounded too, and a value larger than that is
+    not kept at all.
+    """
+
+    def __init__(self, maxsize=32, max_bytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = 0 if self.max_bytes is None else self.sizeof(value)
+        with self._lock:
+            self._data.pop(key, None)
+            self.bytes -= self._sizes.pop(key, 0)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            while len(self._data) > self.maxsize or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                old, _ = self._data.popitem(last=False)
+                self.bytes -= self._sizes.pop(old)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {"size": len(self), "maxsize": self.maxsize, "bytes": self.bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def _check_private(path):
+    """Raise ``PermissionError`` unless ``path`` belongs to this user and only this user can write it."""
+    info = os.stat(path)
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users")
+
+
+class DiskCache:
+    """Pickled results in a SQLite file shared by processes, with a TTL and a size budget.
+
+    Caches with different ``namespace`` values can share one file and one budget.
+    Keys must have a stable ``repr`` (tuples of strings and numbers).
+    """
+
+    def __init__(self, path=RESULT_CACHE_PATH, namespace="", ttl=RESULT_TTL, max_bytes=RESULT_MAX_BYTES):
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.evictions = 0
+        self._local = threading.local()
+
+    def _connect(self):
+        # one connection per thread and process (a forked worker must not reuse its parent's)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            _check_private(directory)
+            if os.path.exists(self.path):
+                _check_private(self.path)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+                         "value BLOB NOT NULL, size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _key(self, key):
+        return hashlib.sha256(repr((RESULT_CACHE_VERSION, self.namespace, key)).encode()).hexdigest()
+
+    def get(self, key, default=None):
+        digest, now = self._key(key), time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT value, expires FROM results WHERE key = ?", (digest,)).fetchone()
+        except (sqlite3.Error, OSError):
+            # unwritable, not private or locked past the timeout: behave as a miss, the caller recomputes
+            row = None
+        if row is not None and row[1] > now:
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                # written by an incompatible version of the package
+                self._try(conn, "DELETE FROM results WHERE key = ?", (digest,))
+            else:
+                self._try(conn, "UPDATE results SET accessed = ? WHERE key = ?", (now, digest))
+                self.hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    @staticmethod
+    def _try(conn, sql, args):
+        # bookkeeping only: a locked or read-only file must not turn a lookup into an error
+        try:
+            conn.execute(sql, args)
+        except sqlite3.Error:
+            pass
+
+    def put(self, key, value):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                             (self._key(key), self.namespace, data, len(data), now + self.ttl, now))
+                self._evict(conn, now)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, conn, now):
+        self.evictions += conn.execute("DELETE FROM results WHERE expires <= ?", (now,)).rowcount
+        excess = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        stale = []
+        for digest, size in conn.execute("SELECT key, size FROM results ORDER BY accessed"):
+            stale.append((digest,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM results WHERE key = ?", stale)
+        self.evictions += len(stale)
+
+    def clear(self):
+        self._connect().execute("DELETE FROM results WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM results WHERE namespace = ? AND expires > ?",
+                                       (self.namespace, time.time())).fetchone()[0]
+
+    def stats(self):
+        size = self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        return {"size": len(self), "bytes": size, "max_bytes": self.max_bytes, "ttl": self.ttl,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class TieredCache:
+    """An in-process cache in front of a :class:`DiskCache`; disk hits are kept in memory too."""
+
+    def __init__(self, memory, disk):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is None:
+            value = self.disk.get(key)
+            if value is None:
+                return default
+            self.memory.put(key, value)
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        self.disk.put(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+
+    def __len__(self):
+        return len(self.memory)
+
+    def stats(self):
+        return {"memory": self.memory.stats(), "disk": self.disk.stats()}
+
+
+def shared_cache(namespace, maxsize=32, max_bytes=None):
+    """LRU of ``maxsize`` entries (and ``max_bytes``, if set) over the host's disk cache, or the LRU alone with
+    ``DASHBOARD_RESULT_CACHE=0``."""
+    memory = LRUCache(maxsize, max_bytes)
+    if os.environ.get("DASHBOARD_RESULT_CACHE", "1") == "0":
+        return memory
+    return TieredCache(memory, DiskCache(namespace=namespace))
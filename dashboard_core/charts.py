@@ -0,0 +1,165 @@
+"""Plotly figures built from cube roll-ups instead of row-level data.
+
+Each builder reduces the selection to a small grouped table first, so the
+figure holds one mark per group and its JSON payload does not grow with
+the number of respondents.  Scatter plots and violins, which do need the
+rows, switch to a stratified sample and to precomputed densities above
+``SAMPLE_THRESHOLD`` rows (see :mod:`.sampling`), with a note saying so.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from .sampling import (SAMPLE_SIZE, SAMPLE_THRESHOLD, category_order, group_values, kde, sample_note,
+                       stratified_sample, weighted_quantiles)
+
+
+def mean_gpa_bar(cube, selection=None, x="University", color="Gender", **kwargs):
+    """True average GPA per group, grouped bars (one bar per ``x`` × ``color``)."""
+    table = cube.rollup([x, color], selection)
+    return px.bar(table, x=x, y="gpa_mean", color=color, barmode="group",
+                  labels={"gpa_mean": "Average GPA"}, hover_data={"count": True}, **kwargs)
+
+
+def count_bar(cube, x, color=None, selection=None, order_by_count=False, **kwargs):
+    """Respondent counts per ``x`` (stacked by ``color``), like ``px.histogram`` on the rows."""
+    by = [x] + ([color] if color else [])
+    table = cube.counts(by, selection)
+    if order_by_count:
+        order = table.groupby(x)["count"].sum().sort_values(ascending=False).index.tolist()
+        kwargs.setdefault("category_orders", {})[x] = order
+    return px.bar(table, x=x, y="count", color=color, **kwargs)
+
+
+def count_pie(cube, names, selection=None, **kwargs):
+    table = cube.counts([names], selection)
+    return px.pie(table, names=names, values="count", **kwargs)
+
+
+def quartile_box(cube, col, x, values, selection=None, y=None, template=None, **kwargs):
+    """Box per ``x`` of the labels of ``col`` read as the numbers ``values``, like ``px.box`` of ``y`` on the rows.
+
+    Quartiles and whiskers (the furthest values within 1.5 IQR) are computed here from the cube's counts, so
+    the figure holds five numbers per box and one marker per distinct outlying value, not the rows.
+    """
+    table = cube.histogram(col, selection, by=[x])
+    table["value"] = table[col].map(values).astype(float)
+    table = table[(table["count"] > 0) & table["value"].notna()].sort_values([x, "value"])
+    stats, outliers = [], []
+    for label, group in table.groupby(x, sort=False):
+        points, counts = group["value"].to_numpy(), group["count"].to_numpy()
+        q1, median, q3 = weighted_quantiles(points, counts, [0.25, 0.5, 0.75])
+        inside = (points >= q1 - 1.5 * (q3 - q1)) & (points <= q3 + 1.5 * (q3 - q1))
+        stats.append((label, q1, median, q3, points[inside][0], points[inside][-1]))
+        outliers += [(label, v, n) for v, n in zip(points[~inside], counts[~inside])]
+    stats = pd.DataFrame(stats, columns=[x, "q1", "median", "q3", "lowerfence", "upperfence"])
+    outliers = pd.DataFrame(outliers, columns=[x, "value", "count"])
+
+    color = pio.templates[template or pio.templates.default].layout.colorway[0]
+    fig = go.Figure(go.Box(x=stats[x], q1=stats["q1"], median=stats["median"], q3=stats["q3"],
+                           lowerfence=stats["lowerfence"], upperfence=stats["upperfence"], marker_color=color,
+                           boxpoints=False, showlegend=False))
+    fig.add_scatter(x=outliers[x], y=outliers["value"], mode="markers", marker_color=color, showlegend=False,
+                    text=[f"n={n:,}" for n in outliers["count"]])
+    fig.update_layout(template=template, **kwargs)
+    fig.update_xaxes(title_text=x)
+    fig.update_yaxes(title_text=y or col)
+    return fig
+
+
+def animated_count_bar(cube, x, frame, color=None, selection=None, **kwargs):
+    """Respondent counts per ``x`` animated over ``frame``, like ``px.histogram(..., animation_frame=frame)``.
+
+    Every frame holds every bar (zero where no one answered) and the y axis fits the largest count,
+    so bars keep their place and scale from one frame to the next.
+    """
+    by = list(dict.fromkeys([frame, x] + ([color] if color else [])))
+    table = cube.counts(by, selection)
+    if table.empty:
+        return px.bar(table, x=x, y="count", color=color, **kwargs)
+    grid = pd.MultiIndex.from_product([table[c].unique() for c in by], names=by)
+    table = table.set_index(by)["count"].reindex(grid, fill_value=0).reset_index()
+    kwargs.setdefault("range_y", [0, table["count"].max() * 1.05])
+    return px.bar(table, x=x, y="count", color=color, animation_frame=frame, **kwargs)
+
+
+def sweep_chart(scores, **kwargs):
+    """Elbow (inertia) and silhouette curves of a k sweep, on two y axes."""
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_scatter(x=scores["k"], y=scores["inertia"], name="Inertia", mode="lines+markers")
+    fig.add_scatter(x=scores["k"], y=scores["silhouette"], name="Silhouette", mode="lines+markers", secondary_y=True)
+    fig.update_xaxes(title_text="k", dtick=1)
+    fig.update_yaxes(title_text="Inertia", secondary_y=False)
+    fig.update_yaxes(title_text="Silhouette", secondary_y=True)
+    return fig.update_layout(**kwargs)
+
+
+def _with_note(fig, note):
+    if note:
+        fig.add_annotation(text=note, xref="paper", yref="paper", x=1, y=1, xanchor="right", yanchor="bottom",
+                           showarrow=False, font_size=11, opacity=0.7)
+    return fig
+
+
+def sampled_scatter(frame, x, y, color=None, strata=None, threshold=SAMPLE_THRESHOLD, size=SAMPLE_SIZE, **kwargs):
+    """``px.scatter`` of the rows, or above ``threshold`` rows of a ``size``-row sample stratified by ``strata``.
+
+    ``color`` is a discrete grouping (numbers are shown as labels) and the default stratum.
+    """
+    strata = list(strata if strata is not None else [color] if color else [])
+    note = None
+    if len(frame) > max(threshold, size):
+        columns = list(dict.fromkeys([x, y, *([color] if color else []), *strata]))
+        rows = stratified_sample(frame[columns], strata, size)
+        note = sample_note(len(rows), len(frame), strata)
+        frame = frame[columns].iloc[rows]
+    if color and not isinstance(frame[color].dtype, pd.CategoricalDtype):
+        frame = frame.assign(**{color: frame[color].astype(str)})
+    return _with_note(px.scatter(frame, x=x, y=y, color=color, **kwargs), note)
+
+
+def kde_violin(frame, y, x, color=None, box=True, threshold=SAMPLE_THRESHOLD, template=None, **kwargs):
+    """``px.violin`` of the rows, or above ``threshold`` rows violins of KDEs computed here, grouped like Plotly's."""
+    if len(frame) <= threshold:
+        return px.violin(frame, y=y, x=x, color=color, box=box, template=template, **kwargs)
+    xs = category_order(frame[x])
+    colors = category_order(frame[color]) if color else [None]
+    groups = group_values(frame, y, [x] + ([color] if color else []))
+    fig = make_subplots()
+    fig.update_layout(template=template, **kwargs)
+    colorway = pio.templates[template or pio.templates.default].layout.colorway
+    slot = 0.8 / len(colors)  # px puts each color's violin side by side within the category
+    for j, c in enumerate(colors):
+        line = colorway[j % len(colorway)]
+        shown = False
+        for i, label in enumerate(xs):
+            key = (label, c) if color else (label,)
+            if key not in groups:
+                continue
+            points, counts = groups[key]
+            grid, density = kde(points, counts)
+            center = i + (j - (len(colors) - 1) / 2) * slot
+            half = density / density.max() * slot / 2  # every violin as wide as its slot, like scalemode="width"
+            hover = f"{x}={label}" + (f"<br>{color}={c}" if color else "") + f"<br>n={counts.sum():,}"
+            # float32 halves the base64 arrays Plotly sends; far finer than a pixel
+            fig.add_scatter(x=np.concatenate([center - half, (center + half)[::-1]]).astype(np.float32),
+                            y=np.concatenate([grid, grid[::-1]]).astype(np.float32), fill="toself", mode="lines",
+                            line_color=line, line_width=1, name=str(c), legendgroup=str(c),
+                            showlegend=bool(color) and not shown, hoveron="fills", hoverinfo="text", text=hover)
+            shown = True
+            if box:
+                q1, median, q3 = weighted_quantiles(points, counts, [0.25, 0.5, 0.75])
+                inside = points[(points >= q1 - 1.5 * (q3 - q1)) & (points <= q3 + 1.5 * (q3 - q1))]
+                fig.add_box(x=[center], q1=[q1], median=[median], q3=[q3], lowerfence=[inside[0]],
+                            upperfence=[inside[-1]], width=slot / 6, marker_color=line, line_width=1,
+                            boxpoints=False, legendgroup=str(c), showlegend=False, hoverinfo="skip")
+    fig.update_xaxes(tickvals=list(range(len(xs))), ticktext=[str(v) for v in xs], title_text=x)
+    fig.update_yaxes(title_text=y)
+    if color:
+        fig.update_layout(legend_title_text=color)
+    note = f"Densities estimated on the server from {sum(c.sum() for _, c in groups.values()):,} values"
+    return _with_note(fig, note)
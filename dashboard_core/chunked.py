@@ -0,0 +1,65 @@
+"""Out-of-core filter -> aggregate, one row batch at a time.
+
+The survey is read in batches of ``CHUNK_ROWS`` rows.  Each batch is
+filtered, reduced to a :class:`SurveyCube` (counts, GPA sums and
+per-column histograms per University/Gender/Year cell) and merged into
+the running cube.  So memory is bounded by one batch plus the cube,
+whatever the size of the file or of the partitioned dataset.  The
+resulting cube serves the KPIs and the grouped charts exactly like the
+cube of an in-memory survey; a :class:`dataset.DatasetStore` whose files
+reach ``AGGREGATE_THRESHOLD`` bytes builds its cube this way.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .cube import SurveyCube
+from .dataset import SurveyDataset, add_partition_columns
+from .filters import FILTER_COLUMNS
+from .store import add_gpa_numeric
+
+CHUNK_ROWS = 100_000
+
+
+def iter_file(path, batch_rows=CHUNK_ROWS):
+    """Batches of a CSV or Parquet survey file, label columns as categoricals."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows):
+            yield add_gpa_numeric(batch.to_pandas(strings_to_categorical=True))
+        return
+    for batch in pd.read_csv(path, dtype="category", chunksize=batch_rows):
+        yield add_gpa_numeric(batch)
+
+
+def iter_batches(source, selection=None, batch_rows=CHUNK_ROWS):
+    """Batches of a survey file or of the partitions of a :class:`SurveyDataset` matching ``selection``."""
+    if isinstance(source, SurveyDataset):
+        for partition in source.prune(selection or {}):
+            for path in partition.files:
+                for batch in iter_file(path, batch_rows):
+                    yield add_partition_columns(batch, partition.values)
+    else:
+        yield from iter_file(source, batch_rows)
+
+
+def batch_mask(batch, selection):
+    mask = np.ones(len(batch), dtype=bool)
+    for col, selected in selection.items():
+        mask &= batch[col].isin(list(selected)).to_numpy()
+    return mask
+
+
+def aggregate(source, selection=None, batch_rows=CHUNK_ROWS, dims=FILTER_COLUMNS):
+    """:class:`SurveyCube` of the rows of ``source`` matching ``selection``, built batch by batch.
+
+    Returns ``None`` when ``source`` has no rows to read.
+    """
+    cube = None
+    for batch in iter_batches(source, selection, batch_rows):
+        if selection:
+            batch = batch[batch_mask(batch, selection)]
+        partial = SurveyCube.from_frame(batch, dims)
+        cube = partial if cube is None else cube.merge(partial)
+    return cube
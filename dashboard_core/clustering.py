@@ -0,0 +1,386 @@
+"""KMeans + PCA clustering of students on GPA and AI knowledge.
+
+AI knowledge enters as its ordinal code from the Likert schema (No <
+Little < Moderate < High knowledge), read from the store's encoded
+matrix rather than re-encoded from the filtered rows.
+
+``features`` switches to clustering on any set of Likert items instead
+(``FEATURE_SETS["All survey items"]``: every ordered question).  The fit
+then reads those columns of the same ``int8`` matrix and only converts
+them to ``float32`` as it goes: whole for the batch engines, chunk by
+chunk for the streaming one.  Results still report GPA and AI knowledge
+per row, so the summary reads the same whatever was clustered on.
+
+Fits are memoized in a bounded LRU keyed by the selected row set and the
+clustering parameters, so reruns caused by unrelated widgets (language,
+dark mode, the feedback box) reuse the previous result.  The LRU sits over
+the host's disk cache, so other worker processes and restarts reuse fits too.
+
+Engines:
+
+* ``"full"`` -- batch KMeans/PCA on every row, the original behaviour
+  (``KMeans(n_clusters, random_state=42)`` on the standardized rows).
+* ``"streaming"`` -- MiniBatchKMeans and IncrementalPCA fitted chunk by
+  chunk, warm-started from the previous centroids when the selection
+  barely changed.
+* ``"weighted"`` -- the features are categorical (5 GPA bands x 4 AI
+  levels), so rows collapse to at most a few dozen distinct points.  The
+  scaler, the k-means++ seeds, KMeans and PCA all run on those points
+  weighted by their counts, which is the objective of the repeated rows,
+  and labels are broadcast back; only collapsing the rows reads every
+  row.  Lloyd runs until the labels stop changing and restarts are nearly
+  free on so few points, so the best of ``WEIGHTED_N_INIT`` is kept: the
+  seeds differ from the full engine's, but its inertia is as low
+  (``tests/test_clustering.py``).
+* ``"auto"`` -- weighted while the feature space is that small, otherwise
+  streaming from ``STREAMING_THRESHOLD`` rows and full below.
+
+:func:`sweep_view` picks the number of clusters: it fits every k of
+``K_RANGE`` on the distinct scaled points, concurrently in a thread pool
+sharing that one matrix, and scores each fit by inertia and by the
+silhouette of a fixed row sample.  The sample's distance matrix is
+computed once for all k, so the sweep stays interactive on large data.
+
+scikit-learn takes over a second to import, so it is only imported by the
+fit functions; importing this module (and the dashboards) stays cheap.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache, shared_cache
+from .cube import AI_COLUMN
+from .likert import LIKERT_SCHEMA, encode_likert
+from .parallel import default_workers
+
+
+CLUSTER_ENGINES = ["auto", "full", "streaming", "weighted"]
+STREAMING_THRESHOLD = 1_000_000
+# "auto" uses the weighted engine while the features have at most this many combinations
+WEIGHTED_MAX_POINTS = 4096
+CHUNK_SIZE = 65536
+# minimum Jaccard overlap with the previous selection to reuse its centroids
+WARM_START_OVERLAP = 0.8
+# KMeans restarts of the full and weighted engines, the best inertia kept; sklearn's n_init="auto" for k-means++
+N_INIT = 1
+WEIGHTED_N_INIT = 10
+# candidate cluster counts of the k sweep, and the rows its silhouette is computed on
+K_RANGE = range(2, 9)
+SILHOUETTE_SAMPLE = 2000
+# name -> Likert columns to cluster on; None is GPA + AI knowledge
+FEATURE_SETS = {
+    "GPA + AI knowledge": None,
+    "All survey items": tuple(LIKERT_SCHEMA),
+}
+
+
+class ClusterResult:
+    def __init__(self, data, centers=None, inertia=None, engine="full", warm_started=False):
+        self.data = data  # GPA_Numeric, AI_Knowledge, Cluster, PC1, PC2 per student
+        self.centers = centers  # centroids in feature units (unscaled)
+        self.inertia = inertia
+        self.engine = engine
+        self.warm_started = warm_started
+        self.summary = (data.groupby("Cluster")
+                        .agg(students=("Cluster", "size"),
+                             avg_gpa=("GPA_Numeric", "mean"),
+                             avg_ai=("AI_Knowledge", "mean"))
+                        .reset_index())
+
+
+class SweepResult:
+    def __init__(self, scores):
+        self.scores = scores  # k, inertia, silhouette per candidate (NaN when k could not be scored)
+        scored = scores.dropna(subset=["silhouette"])
+        self.best_k = int(scored.loc[scored["silhouette"].idxmax(), "k"] if len(scored) else scores["k"].iloc[0])
+
+
+cluster_cache = shared_cache("clusters", maxsize=32)
+sweep_cache = shared_cache("sweeps", maxsize=16)
+point_cache = LRUCache(maxsize=32)
+
+
+def clustering_features(frame, likert=None):
+    """GPA and the ordinal AI knowledge code per row; ``likert`` holds the codes of these rows, if already encoded."""
+    data = frame[["GPA_Numeric"]].astype("float64")
+    if likert is None:
+        likert = encode_likert(frame[[AI_COLUMN]])
+    data["AI_Knowledge"] = likert.column(AI_COLUMN)
+    return data
+
+
+def feature_matrix(frame, likert=None, features=None):
+    """Reported columns of ``frame`` (:func:`clustering_features`) and the matrix to cluster on.
+
+    The matrix is those two columns as ``float64``, or the ``int8`` Likert codes of ``features``
+    (the columns missing from ``frame`` are left out).
+    """
+    if features is not None and likert is None:
+        likert = encode_likert(frame)
+    data = clustering_features(frame, likert)
+    if features is None:
+        return data, data.to_numpy(dtype=np.float64)
+    columns = [likert.columns.index(c) for c in features if c in likert.columns]
+    return data, likert.codes[:, columns]
+
+
+def _dense(X):
+    # int8 codes are widened only to float32; sklearn keeps float32 through scaling, KMeans and PCA
+    return X if X.dtype.kind == "f" else X.astype(np.float32)
+
+
+def feature_space_size(frame, features=None):
+    """Upper bound on distinct feature rows, read from the categorical dtypes or the schema (missing included)."""
+    if features is None:
+        return (len(frame["GPA"].cat.categories) + 1) * (len(frame[AI_COLUMN].cat.categories) + 1)
+    return int(np.prod([len(LIKERT_SCHEMA[c]) + 1 for c in features if c in frame.columns], dtype=np.float64))
+
+
+def collapse_rows(X):
+    """Distinct rows of ``X`` with counts, and the row -> distinct-row mapping, in O(rows)."""
+    key = np.zeros(len(X), dtype=np.int64)
+    for j in range(X.shape[1]):
+        codes, uniques = pd.factorize(X[:, j])
+        key = key * (len(uniques) + 1) + codes + 1
+    inverse = pd.factorize(key)[0]
+    counts = np.bincount(inverse)
+    first = np.zeros(len(counts), dtype=np.int64)
+    first[inverse[::-1]] = np.arange(len(X) - 1, -1, -1)  # first row of each distinct key
+    return X[first], inverse, counts
+
+
+def distinct_points(view, features=None, cache=point_cache):
+    """Number of distinct feature rows of a :class:`FilteredView`: the most clusters it can be split into."""
+    features = None if features is None else tuple(features)
+    key = (view.key, features)
+    n = cache.get(key)
+    if n is None:
+        n = len(collapse_rows(feature_matrix(view.frame, view.likert, features)[1])[0])
+        cache.put(key, n)
+    return n
+
+
+def initial_centers(points, weights, n_clusters, random_state):
+    """Weighted k-means++ seeds drawn from the distinct points, for the weighted engine and the k sweep.
+
+    The sweep's fits run Lloyd with ``tol=0`` (until labels stop changing): sklearn scales ``tol``
+    by the unweighted feature variance, which differs between the points and the rows they stand for.
+    """
+    from sklearn.cluster import kmeans_plusplus
+
+    if len(points) < n_clusters:
+        return "k-means++"
+    centers, _ = kmeans_plusplus(points, n_clusters, sample_weight=weights.astype(np.float64),
+                                 random_state=random_state)
+    return centers
+
+
+def fit_clusters(frame, n_clusters=3, random_state=42, likert=None, features=None):
+    from sklearn.cluster import KMeans
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    data, X = feature_matrix(frame, likert, features)
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(_dense(X))
+
+    kmeans = KMeans(n_clusters=n_clusters, n_init=N_INIT, random_state=random_state)
+    data["Cluster"] = kmeans.fit_predict(X_scaled)
+
+    pca = PCA(n_components=2)
+    data[["PC1", "PC2"]] = pca.fit_transform(X_scaled)
+    return ClusterResult(data, scaler.inverse_transform(kmeans.cluster_centers_), kmeans.inertia_, "full")
+
+
+def _chunks(n_rows, chunk_size, random_state):
+    # shuffled so each mini-batch mixes universities/years instead of following file order
+    order = np.random.default_rng(random_state).permutation(n_rows)
+    return np.array_split(order, max(1, -(-n_rows // chunk_size)))
+
+
+def fit_clusters_streaming(frame, n_clusters=3, random_state=42, init_centers=None, chunk_size=CHUNK_SIZE,
+                           likert=None, features=None):
+    """One pass of MiniBatchKMeans/IncrementalPCA over row chunks.
+
+    ``init_centers`` (feature units) warm-starts the centroids instead of k-means++.
+    """
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.decomposition import IncrementalPCA
+    from sklearn.preprocessing import StandardScaler
+
+    data, X = feature_matrix(frame, likert, features)
+    chunks = _chunks(len(X), chunk_size, random_state)
+
+    scaler = StandardScaler()
+    for rows in chunks:
+        scaler.partial_fit(_dense(X[rows]))
+
+    init = "k-means++" if init_centers is None else scaler.transform(init_centers)
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, init=init, n_init=1,
+                             batch_size=chunk_size, random_state=random_state)
+    pca = IncrementalPCA(n_components=2)
+    for rows in chunks:
+        X_chunk = scaler.transform(_dense(X[rows]))
+        kmeans.partial_fit(X_chunk)
+        pca.partial_fit(X_chunk)
+
+    labels = np.empty(len(X), dtype=np.int32)
+    components = np.empty((len(X), 2))
+    inertia = 0.0
+    for rows in chunks:
+        X_chunk = scaler.transform(_dense(X[rows]))
+        labels[rows] = kmeans.predict(X_chunk)
+        components[rows] = pca.transform(X_chunk)
+        inertia += ((X_chunk - kmeans.cluster_centers_[labels[rows]]) ** 2).sum()
+
+    data["Cluster"] = labels
+    data["PC1"], data["PC2"] = components[:, 0], components[:, 1]
+    return ClusterResult(data, scaler.inverse_transform(kmeans.cluster_centers_), inertia, "streaming",
+                         warm_started=init_centers is not None)
+
+
+def weighted_pca(X, weights, n_components=2):
+    """PCA of weighted points; matches sklearn's PCA on the repeated rows up to component signs."""
+    mean = np.average(X, axis=0, weights=weights)
+    centered = X - mean
+    cov = (centered * weights[:, None]).T @ centered / weights.sum()
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    components = eigvecs[:, np.argsort(eigvals)[::-1][:n_components]].T
+    # same sign convention as sklearn: largest-magnitude loading positive
+    signs = np.sign(components[np.arange(len(components)), np.abs(components).argmax(axis=1)])
+    components *= np.where(signs == 0, 1, signs)[:, None]
+    return centered @ components.T
+
+
+def fit_clusters_weighted(frame, n_clusters=3, random_state=42, likert=None, features=None):
+    """KMeans and PCA on the distinct feature rows weighted by their counts, the labels broadcast to the rows."""
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+
+    data, X = feature_matrix(frame, likert, features)
+    points, inverse, counts = collapse_rows(X)
+    if len(points) < n_clusters:
+        # fewer distinct points than clusters: KMeans needs the duplicated rows
+        return fit_clusters(frame, n_clusters, random_state, likert, features)
+    points = _dense(points)
+    weights = counts.astype(points.dtype)
+    scaler = StandardScaler().fit(points, sample_weight=weights)
+    points_scaled = scaler.transform(points)
+
+    # tol=0: sklearn scales tol by the unweighted variance of the points, not that of the rows
+    rng = np.random.RandomState(random_state)
+    best = None
+    for _ in range(WEIGHTED_N_INIT):
+        kmeans = KMeans(n_clusters=n_clusters, init=initial_centers(points_scaled, weights, n_clusters, rng),
+                        n_init=1, tol=0, random_state=rng)
+        kmeans.fit(points_scaled, sample_weight=weights)
+        if best is None or kmeans.inertia_ < best.inertia_:
+            best = kmeans
+    point_components = weighted_pca(points_scaled, weights)
+
+    data["Cluster"] = best.labels_[inverse]
+    data["PC1"], data["PC2"] = point_components[inverse, 0], point_components[inverse, 1]
+    return ClusterResult(data, scaler.inverse_transform(best.cluster_centers_), best.inertia_, "weighted")
+
+
+def _popcount(mask, n_rows):
+    return int(np.unpackbits(mask, count=n_rows).sum())
+
+
+def selection_overlap(a, b, n_rows):
+    """Jaccard overlap of two packed row bitmaps (``None`` = every row)."""
+    full = np.packbits(np.ones(n_rows, dtype=bool))
+    a = full if a is None else a
+    b = full if b is None else b
+    union = _popcount(a | b, n_rows)
+    return _popcount(a & b, n_rows) / union if union else 1.0
+
+
+# (fingerprint, n_clusters, random_state, features) -> (mask, centers) of the last streaming fit
+_last_fit = LRUCache(maxsize=16)
+
+
+def resolve_engine(engine, view, features=None):
+    if engine == "auto":
+        if feature_space_size(view.source, features) <= WEIGHTED_MAX_POINTS:
+            return "weighted"
+        return "streaming" if len(view) >= STREAMING_THRESHOLD else "full"
+    if engine not in CLUSTER_ENGINES:
+        raise ValueError(f"unknown clustering engine {engine!r}, expected one of {CLUSTER_ENGINES}")
+    return engine
+
+
+def cluster_view(view, n_clusters=3, random_state=42, engine="auto", features=None, cache=cluster_cache):
+    """Clustering of a :class:`FilteredView`, fitted at most once per selection and parameters.
+
+    ``features`` are Likert columns to cluster on instead of GPA and AI knowledge.
+    The returned result is shared between reruns and must not be modified.
+    """
+    features = None if features is None else tuple(features)
+    engine = resolve_engine(engine, view, features)
+    key = (view.key, n_clusters, random_state, engine, features)
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    if engine == "streaming":
+        warm_key = (view.fingerprint, n_clusters, random_state, features)
+        previous = _last_fit.get(warm_key)
+        init = None
+        if previous is not None and selection_overlap(previous[0], view.mask, view.n_rows) >= WARM_START_OVERLAP:
+            init = previous[1]
+        result = fit_clusters_streaming(view.frame, n_clusters, random_state, init_centers=init,
+                                        likert=view.likert, features=features)
+        _last_fit.put(warm_key, (view.mask, result.centers))
+    elif engine == "weighted":
+        result = fit_clusters_weighted(view.frame, n_clusters, random_state, likert=view.likert, features=features)
+    else:
+        result = fit_clusters(view.frame, n_clusters, random_state, likert=view.likert, features=features)
+    cache.put(key, result)
+    return result
+
+
+def sweep_clusters(frame, k_values=K_RANGE, random_state=42, likert=None, features=None, workers=None,
+                   sample_size=SILHOUETTE_SAMPLE):
+    """Inertia and sampled silhouette of a KMeans fit for each of ``k_values``; the fits share one scaled matrix."""
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import pairwise_distances, silhouette_score
+    from sklearn.preprocessing import StandardScaler
+
+    _, X = feature_matrix(frame, likert, features)
+    points, inverse, counts = collapse_rows(X)
+    points = _dense(points)
+    weights = counts.astype(points.dtype)
+    points_scaled = StandardScaler().fit(points, sample_weight=weights).transform(points)
+    rng = np.random.default_rng(random_state)
+    sample = inverse[rng.choice(len(X), size=min(sample_size, len(X)), replace=False)]
+    distances = pairwise_distances(points_scaled[sample])
+
+    def score(k):
+        if k > len(points):
+            return k, np.nan, np.nan
+        kmeans = KMeans(n_clusters=k, init=initial_centers(points_scaled, weights, k, random_state),
+                        n_init=1, tol=0, random_state=random_state)
+        kmeans.fit(points_scaled, sample_weight=weights)
+        labels = kmeans.labels_[sample]
+        n_labels = len(np.unique(labels))
+        silhouette = silhouette_score(distances, labels, metric="precomputed") if 1 < n_labels < len(sample) else np.nan
+        return k, kmeans.inertia_, silhouette
+
+    k_values = list(k_values)
+    with ThreadPoolExecutor(min(len(k_values), workers or default_workers())) as pool:
+        scores = list(pool.map(score, k_values))
+    return SweepResult(pd.DataFrame(scores, columns=["k", "inertia", "silhouette"]))
+
+
+def sweep_view(view, k_values=K_RANGE, random_state=42, features=None, cache=sweep_cache):
+    """:func:`sweep_clusters` of a :class:`FilteredView`, run at most once per selection and parameters."""
+    features = None if features is None else tuple(features)
+    key = (view.key, tuple(k_values), random_state, features)
+    result = cache.get(key)
+    if result is None:
+        result = sweep_clusters(view.frame, k_values, random_state, likert=view.likert, features=features)
+        cache.put(key, result)
+    return result
@@ -0,0 +1,138 @@
+"""Pre-aggregated survey cube.
+
+Respondents are reduced once to one cell per (University, Gender, Year of
+Study) combination holding the row count, the GPA sum and, for every other
+label column, a histogram of its values.  Filtering only ever selects whole
+cells, so KPIs and grouped charts are roll-ups over at most a few dozen
+cells whatever the number of respondents.  Cubes of disjoint row sets
+merge by label (:meth:`SurveyCube.merge`), so appended rows only need a
+cube of their own.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .filters import FILTER_COLUMNS
+
+AI_COLUMN = "AI and Automation Knowledge Level"
+
+
+class SurveyCube:
+    def __init__(self, cells, hists, categories):
+        self.cells = cells  # one row per cell: dimension labels, count, gpa_sum, gpa_n
+        self.hists = hists  # column -> (n_cells, n_categories) counts
+        self.categories = categories  # column -> category labels, in histogram order
+        self.dims = [c for c in cells.columns if c not in ("count", "gpa_sum", "gpa_n")]
+
+    @classmethod
+    def from_frame(cls, frame, dims=FILTER_COLUMNS):
+        n = len(frame)
+        dim_codes = [frame[d].cat.codes.to_numpy().astype(np.int64) for d in dims]
+        sizes = [len(frame[d].cat.categories) + 1 for d in dims]  # +1 slot for missing
+        cell_key = np.zeros(n, dtype=np.int64)
+        for codes, size in zip(dim_codes, sizes):
+            cell_key = cell_key * size + (codes + 1)
+        keys, inverse = np.unique(cell_key, return_inverse=True)
+        n_cells = len(keys)
+
+        cells = {}
+        rest = keys
+        for d, size in reversed(list(zip(dims, sizes))):
+            rest, code = np.divmod(rest, size)
+            labels = np.asarray(frame[d].cat.categories, dtype=object)
+            cells[d] = np.where(code > 0, labels[np.maximum(code - 1, 0)], None)
+        cells = pd.DataFrame({d: cells[d] for d in dims})
+
+        gpa = frame["GPA_Numeric"].to_numpy(dtype=np.float64)
+        has_gpa = ~np.isnan(gpa)
+        cells["count"] = np.bincount(inverse, minlength=n_cells)
+        cells["gpa_sum"] = np.bincount(inverse, weights=np.where(has_gpa, gpa, 0.0), minlength=n_cells)
+        cells["gpa_n"] = np.bincount(inverse, weights=has_gpa, minlength=n_cells).astype(np.int64)
+
+        hists, categories = {}, {}
+        for col in frame.columns:
+            if col in dims or not isinstance(frame[col].dtype, pd.CategoricalDtype):
+                continue
+            codes = frame[col].cat.codes.to_numpy()
+            k = len(frame[col].cat.categories)
+            valid = codes >= 0
+            flat = np.bincount(inverse[valid] * k + codes[valid], minlength=n_cells * k)
+            hists[col] = flat.reshape(n_cells, k)
+            categories[col] = list(frame[col].cat.categories)
+        return cls(cells, hists, categories)
+
+    def merge(self, other):
+        """Cube of the rows of both cubes: cells with the same labels are added up."""
+        cells = pd.concat([self.cells, other.cells], ignore_index=True)
+        groups = cells.groupby(self.dims, dropna=False, sort=False)
+        group = groups.ngroup().to_numpy()
+        merged = groups[["count", "gpa_sum", "gpa_n"]].sum().reset_index()
+
+        hists, categories = {}, {}
+        for col in self.hists.keys() | other.hists.keys():
+            labels = sorted(set(self.categories.get(col, [])) | set(other.categories.get(col, [])))
+            pos = {label: i for i, label in enumerate(labels)}
+            stacked = np.zeros((len(cells), len(labels)), dtype=np.int64)
+            for cube, rows in ((self, slice(0, len(self.cells))), (other, slice(len(self.cells), None))):
+                if col in cube.hists:
+                    stacked[rows, [pos[c] for c in cube.categories[col]]] = cube.hists[col]
+            hists[col] = np.zeros((len(merged), len(labels)), dtype=np.int64)
+            np.add.at(hists[col], group, stacked)
+            categories[col] = labels
+        return SurveyCube(merged, hists, categories)
+
+    def cell_mask(self, selection=None):
+        mask = np.ones(len(self.cells), dtype=bool)
+        for col, selected in (selection or {}).items():
+            mask &= self.cells[col].isin(list(selected)).to_numpy()
+        return mask
+
+    def rollup(self, by, selection=None):
+        """Counts and GPA totals grouped by ``by`` over the selected cells."""
+        cells = self.cells[self.cell_mask(selection)]
+        out = cells.groupby(list(by), sort=True)[["count", "gpa_sum", "gpa_n"]].sum().reset_index()
+        out = out[out["count"] > 0]
+        out["gpa_mean"] = out["gpa_sum"] / out["gpa_n"].where(out["gpa_n"] > 0)
+        return out
+
+    def histogram(self, col, selection=None, by=None):
+        """Value counts of ``col`` over the selected cells, optionally split by dimensions."""
+        mask = self.cell_mask(selection)
+        counts = self.hists[col][mask]
+        if not by:
+            return pd.Series(counts.sum(axis=0), index=pd.Index(self.categories[col], name=col), name="count")
+        wide = pd.DataFrame(counts, columns=self.categories[col])
+        for d in by:
+            wide[d] = self.cells[d].to_numpy()[mask]
+        long = wide.melt(id_vars=list(by), var_name=col, value_name="count")
+        return long.groupby(list(by) + [col], sort=True)["count"].sum().reset_index()
+
+    def counts(self, by, selection=None):
+        """Respondent counts grouped by ``by``: dimensions plus at most one label column."""
+        by = list(by)
+        labels = [c for c in by if c not in self.dims]
+        if not labels:
+            return self.rollup(by, selection)[by + ["count"]]
+        if len(labels) > 1:
+            raise ValueError(f"the cube only crosses one label column with the dimensions, got {labels}")
+        dims = [c for c in by if c in self.dims]
+        table = self.histogram(labels[0], selection, by=dims)
+        table = table.reset_index() if not dims else table
+        return table[table["count"] > 0][by + ["count"]].reset_index(drop=True)
+
+    def kpis(self, selection=None):
+        """The dashboard's headline numbers for a filter selection."""
+        mask = self.cell_mask(selection)
+        cells = self.cells[mask & (self.cells["count"] > 0).to_numpy()]
+        students = int(cells["count"].sum())
+        if students == 0:
+            return {"students": 0, "universities": 0, "gpa": 0, "ai": "N/A"}
+        gpa_n = cells["gpa_n"].sum()
+        ai_counts = self.hists[AI_COLUMN][mask].sum(axis=0)
+        return {
+            "students": students,
+            "universities": int(cells["University"].nunique()),
+            "gpa": round(float(cells["gpa_sum"].sum() / gpa_n), 2) if gpa_n else 0,
+            # argmax takes the first of tied categories, matching Series.mode()[0]
+            "ai": self.categories[AI_COLUMN][int(np.argmax(ai_counts))] if ai_counts.any() else "N/A",
+        }
@@ -0,0 +1,297 @@
+"""Survey waves stored as a Hive-style partitioned directory.
+
+    waves/city=Ankara/university=Gazi University/year=2/part-0.csv
+    waves/city=Ankara/university=Gazi University/year=3/part-0.parquet
+
+Partition values come from the directory names (URL-encoded like Hive and
+pyarrow write them), so listing the tree is enough to fill the University
+and Year filters.  :meth:`SurveyDataset.load` keeps only the partitions
+matching the selection and opens just their files; CSV files go through
+the same Arrow cache as the single-file survey, kept under one directory,
+``PARTITION_CACHE_DIR``, not beside each file, so the data tree may be
+read-only.  Files may leave out the partition columns, which are then
+filled in from the directory names.
+
+:func:`open_data` shares one :class:`SurveyDataset` per root across
+reruns and walks the tree again only once a directory it listed has a
+new mtime, i.e. a partition or file was added, removed or renamed.
+
+The loaded partitions are concatenated only once rows are needed.  When
+their files add up to ``AGGREGATE_THRESHOLD`` bytes or more they are never
+concatenated: the cube behind the filter options, the KPIs and the
+grouped charts is built by :func:`chunked.aggregate`, one batch at a time,
+and a filter selection (:class:`DatasetView`) reads only its own rows,
+batch by batch, when a section first needs them.  :func:`open_data` sends
+a single survey file of that size through the same path.
+"""
+
+import hashlib
+import os
+import threading
+from functools import cached_property
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache
+from .filters import FilteredView
+from .store import SurveyStore, add_gpa_numeric, concat_frames, open_survey, read_survey
+
+# directory key -> survey column
+PARTITION_KEYS = {"city": "City", "university": "University", "year": "Year of Study"}
+DATA_SUFFIXES = (".csv", ".parquet")
+# bytes of the loaded files from which they are aggregated and filtered batch by batch
+AGGREGATE_THRESHOLD = int(os.environ.get("DASHBOARD_AGGREGATE_THRESHOLD", 256 << 20))
+PARTITION_CACHE_DIR = os.environ.get("SURVEY_PARTITION_CACHE",
+                                     os.path.abspath(os.path.join(".survey_cache", "partitions")))
+
+dataset_cache = LRUCache(maxsize=4)
+_datasets = {}  # root -> SurveyDataset
+_lock = threading.Lock()
+
+
+class Partition:
+    def __init__(self, values, files):
+        self.values = values  # survey column -> value, from the directory names
+        self.files = files
+
+    def matches(self, selection):
+        return all(self.values[col] in set(selected) for col, selected in selection.items() if col in self.values)
+
+
+def _scan(root):
+    """Partitions under ``root`` and the mtimes of the directories listed; hidden and ``_``-prefixed
+    entries are skipped, as Hive does.
+
+    A file ``root`` is a single partition without partition columns.
+    """
+    if os.path.isfile(root):
+        return [Partition({}, [root])], {}
+    partitions, mtimes = [], {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "_")))
+        files = sorted(os.path.join(dirpath, f) for f in filenames
+                       if f.endswith(DATA_SUFFIXES) and not f.startswith((".", "_")))
+        if not files:
+            continue
+        values = {}
+        for part in os.path.relpath(dirpath, root).split(os.sep):
+            key, sep, value = part.partition("=")
+            if sep:
+                values[PARTITION_KEYS.get(key, key)] = unquote(value)
+        partitions.append(Partition(values, files))
+    return partitions, mtimes
+
+
+def partition_cache_dir(path):
+    """Directory of the Arrow cache of the partition file ``path``: one per data directory."""
+    directory = os.path.dirname(os.path.abspath(path))
+    return os.path.join(PARTITION_CACHE_DIR, hashlib.sha1(directory.encode()).hexdigest()[:16])
+
+
+def _read_file(path):
+    if path.endswith(".csv"):
+        return read_survey(path, partition_cache_dir(path)).frame
+    import pyarrow.parquet as pq
+
+    frame = pq.read_table(path).to_pandas(strings_to_categorical=True)
+    return frame if "GPA_Numeric" in frame.columns else add_gpa_numeric(frame)
+
+
+def add_partition_columns(frame, values):
+    """Partition columns missing from the file, filled in from the directory names and put first."""
+    missing = {col: v for col, v in values.items() if col not in frame.columns}
+    if not missing:
+        return frame
+    added = pd.DataFrame({col: pd.Categorical.from_codes(np.zeros(len(frame), dtype=np.int8), [v])
+                          for col, v in missing.items()}, index=frame.index)
+    return pd.concat([added, frame], axis=1)
+
+
+class DatasetStore(SurveyStore):
+    """:class:`SurveyStore` of the partitions of ``dataset`` matching ``selection``, concatenated on first use.
+
+    From ``AGGREGATE_THRESHOLD`` bytes on (:attr:`out_of_core`) the frame is never built: the filter
+    options and the cube come from :func:`chunked.aggregate` and selections are :class:`DatasetView` s.
+    """
+
+    def __init__(self, dataset, selection, nbytes, fingerprint):
+        super().__init__(None, source=dataset.root, fingerprint=fingerprint)
+        del self.frame  # the cached property below
+        self.dataset = dataset
+        self.selection = selection
+        self.nbytes = nbytes
+        self._views = LRUCache(maxsize=2)
+
+    @property
+    def out_of_core(self):
+        return self.nbytes >= AGGREGATE_THRESHOLD
+
+    @cached_property
+    def frame(self):
+        frames = [add_partition_columns(_read_file(f), p.values)
+                  for p in self.dataset.prune(self.selection) for f in p.files]
+        frame = concat_frames(frames) if frames else self.dataset._empty_frame()
+        self.dataset._schema = frame.iloc[:0]
+        return frame
+
+    def _build_cube(self):
+        if self.out_of_core:
+            from .chunked import aggregate
+
+            cube = aggregate(self.dataset, self.selection)
+            if cube is not None:
+                return cube
+        return super()._build_cube()
+
+    def values(self, col):
+        if not self.out_of_core:
+            return super().values(col)
+        cells = self.cube.cells
+        return list(pd.unique(cells.loc[cells["count"] > 0, col].dropna()))
+
+    def select(self, selection):
+        if not self.out_of_core:
+            return super().select(selection)
+        view = DatasetView(self, selection)
+        # the same view object across reruns, so its rows are read once per selection
+        cached = self._views.get(view.key)
+        if cached is None:
+            self._views.put(view.key, view)
+            return view
+        return cached
+
+
+class DatasetView(FilteredView):
+    """Rows of an out-of-core :class:`DatasetStore` matching ``selection``, read batch by batch on first use.
+
+    Only the matching rows are kept.  Until then the length comes from the store's cube.
+    """
+
+    def __init__(self, store, selection):
+        self.store = store
+        self.selection = {col: list(selected) for col, selected in selection.items()}
+        self.mask = None  # every row of the source below is selected
+        self.encoded = None
+
+    @cached_property
+    def key(self):
+        h = hashlib.sha1(f"{self.store.fingerprint}:".encode())
+        h.update(repr(sorted((col, sorted(map(str, v))) for col, v in self.selection.items())).encode())
+        return h.hexdigest()
+
+    @property
+    def fingerprint(self):
+        # the selected rows are this view's whole source
+        return self.key
+
+    @cached_property
+    def source(self):
+        from .chunked import batch_mask, iter_batches
+
+        selection = {**self.store.selection, **self.selection}
+        frames = [batch[batch_mask(batch, selection)] for batch in iter_batches(self.store.dataset, selection)]
+        return concat_frames(frames) if frames else self.store.dataset._empty_frame()
+
+    @property
+    def n_rows(self):
+        return len(self)
+
+    def __len__(self):
+        if "source" in self.__dict__:
+            return len(self.source)
+        return self.store.cube.kpis(self.selection)["students"]
+
+
+class SurveyDataset:
+    """A partitioned directory of survey files, read one pruned selection at a time."""
+
+    def __init__(self, root, cache=dataset_cache):
+        self.root = os.path.abspath(root)
+        self.cache = cache
+        self.partitions, self.mtimes = _scan(self.root)
+        if not self.partitions:
+            raise FileNotFoundError(f"no {'/'.join(DATA_SUFFIXES)} files under {self.root}")
+        self._schema = None
+        # partition columns, outermost directory level first
+        self.columns = list(dict.fromkeys(col for p in self.partitions for col in p.values))
+
+    def changed(self):
+        """Whether a directory listed by the scan was modified or removed since."""
+        try:
+            return any(os.stat(d).st_mtime_ns != mtime for d, mtime in self.mtimes.items())
+        except FileNotFoundError:
+            return True
+
+    def _empty_frame(self):
+        # the columns of the last load; before any load, one file is read for them
+        if self._schema is None:
+            p = self.partitions[0]
+            self._schema = add_partition_columns(_read_file(p.files[0]).iloc[:0], p.values)
+        return self._schema
+
+    def values(self, col):
+        """Distinct values of a partition column, read from the directory names only."""
+        return sorted({p.values[col] for p in self.partitions if col in p.values})
+
+    def prune(self, selection):
+        return [p for p in self.partitions if p.matches(selection)]
+
+    def files(self, selection):
+        return [f for p in self.prune(selection) for f in p.files]
+
+    def load(self, selection):
+        """:class:`DatasetStore` of the partitions matching ``selection``; other files are never opened."""
+        stamps = []
+        for f in self.files(selection):
+            info = os.stat(f)
+            stamps.append((f, info.st_mtime_ns, info.st_size))
+        key = (self.root, tuple(stamps))
+        store = self.cache.get(key)
+        if store is not None:
+            return store
+
+        fingerprint = hashlib.sha256(repr(key).encode()).hexdigest()
+        store = DatasetStore(self, selection, sum(size for _, _, size in stamps), fingerprint)
+        self.cache.put(key, store)
+        return store
+
+
+def write_partitioned(frame, root, city="Ankara", fmt="csv", part="part-0"):
+    """Write ``frame`` under ``root`` partitioned by city, university and year (partition columns left out)."""
+    columns = {v: k for k, v in PARTITION_KEYS.items()}
+    by = [c for c in ("University", "Year of Study") if c in frame.columns]
+    written = []
+    for values, rows in frame.groupby(by, observed=True, sort=True):
+        parts = [f"city={quote(city, safe=' ')}"]
+        parts += [f"{columns[c]}={quote(str(v), safe=' ')}" for c, v in zip(by, values)]
+        directory = os.path.join(root, *parts)
+        os.makedirs(directory, exist_ok=True)
+        rows = rows.drop(columns=by + ["GPA_Numeric"], errors="ignore")
+        path = os.path.join(directory, f"{part}.{fmt}")
+        if fmt == "csv":
+            rows.to_csv(path, index=False)
+        else:
+            rows.to_parquet(path, index=False)
+        written.append(path)
+    return written
+
+
+def open_dataset(root):
+    """The shared :class:`SurveyDataset` of ``root``, scanned again once one of its directories changed."""
+    root = os.path.abspath(root)
+    with _lock:
+        ds = _datasets.get(root)
+        if ds is None or ds.changed():
+            ds = _datasets[root] = SurveyDataset(root)
+        return ds
+
+
+def open_data(path):
+    """A :class:`SurveyDataset` for a partitioned directory or a file of ``AGGREGATE_THRESHOLD`` bytes or more,
+    else the shared single-file store."""
+    if os.path.isdir(path) or os.path.getsize(path) >= AGGREGATE_THRESHOLD:
+        return open_dataset(path)
+    return open_survey(path)
@@ -0,0 +1,233 @@
+"""CSV and PDF exports of the filtered survey.
+
+The PDF is written as fixed-size A4 landscape pages, one page at a time:
+rows are converted to text chunk by chunk and each finished page is
+compressed and flushed to the output, so memory stays bounded by one
+chunk plus one page whatever the number of rows.  fpdf is not used here:
+it keeps every page in memory and concatenates the document into a single
+string, which becomes quadratic on large exports.
+
+No value is cut short.  A column is as wide as its longest value, up to
+``MAX_COL_CHARS``; longer values and the headers wrap onto further lines
+of their cell.  Columns that do not fit across one page continue on the
+next ones: each block of rows is printed once per column group, on
+consecutive pages, and every row keeps its line positions on all of them.
+
+Text uses the standard Courier fonts, which are not embedded, with
+WinAnsi (Latin-1) encoding.  Its unused codes 0x80-0x9F are remapped to
+the Latin Extended letters of ``EXTRA_GLYPHS``, which includes Turkish
+(ğ ı İ ş Ş) and Polish, Czech and Hungarian letters, plus typographic
+quotes and dashes.  Any other character, e.g. Greek, Cyrillic or CJK,
+is written as "?"; the CSV export keeps every character.
+
+In the apps the files are produced only when a download button is
+clicked (:func:`deferred`) and kept per filter selection, so ordinary
+reruns serialize nothing.  The files kept in memory add up to at most
+``EXPORT_CACHE_BYTES``; a file above ``EXPORT_CACHE_MAX_FILE`` is not
+cached at all (nor pickled for the disk cache) and is rebuilt on the next
+click.
+"""
+
+import io
+import textwrap
+import zlib
+
+import pandas as pd
+
+from .cache import shared_cache
+from .profiling import section
+
+PAGE_WIDTH, PAGE_HEIGHT = 842, 595  # A4 landscape, pt
+MARGIN = 24
+FONT_SIZE = 5.5
+LEADING = 7.5
+CHAR_WIDTH = 0.6 * FONT_SIZE  # Courier is monospaced
+MIN_COL_CHARS = 4
+MAX_COL_CHARS = 40
+CHUNK_ROWS = 5000
+
+EXPORT_FORMATS = {"csv": "text/csv", "pdf": "application/pdf"}
+EXPORT_CACHE_BYTES = 64 << 20
+EXPORT_CACHE_MAX_FILE = 16 << 20
+export_cache = shared_cache("exports", maxsize=8, max_bytes=EXPORT_CACHE_BYTES)
+
+
+def csv_bytes(frame):
+    return frame.to_csv(index=False).encode("utf-8")
+
+
+# characters outside Latin-1 given the codes 0x80-0x9F, with their glyph names in the standard fonts
+EXTRA_GLYPHS = [
+    ("ğ", "gbreve"), ("Ğ", "Gbreve"), ("ı", "dotlessi"), ("İ", "Idotaccent"), ("ş", "scedilla"),
+    ("Ş", "Scedilla"), ("ą", "aogonek"), ("ć", "cacute"), ("č", "ccaron"), ("Č", "Ccaron"),
+    ("ę", "eogonek"), ("ł", "lslash"), ("Ł", "Lslash"), ("ń", "nacute"), ("ő", "ohungarumlaut"),
+    ("ř", "rcaron"), ("ś", "sacute"), ("š", "scaron"), ("Š", "Scaron"), ("ű", "uhungarumlaut"),
+    ("ź", "zacute"), ("ż", "zdotaccent"), ("ž", "zcaron"), ("Ž", "Zcaron"), ("€", "Euro"),
+    ("‘", "quoteleft"), ("’", "quoteright"), ("“", "quotedblleft"), ("”", "quotedblright"),
+    ("–", "endash"), ("—", "emdash"), ("…", "ellipsis"),
+]
+_PDF_CHARS = {code: "?" for code in range(0x80, 0xA0)}
+_PDF_CHARS.update({ord(char): chr(0x80 + i) for i, (char, _) in enumerate(EXTRA_GLYPHS)})
+_PDF_ENCODING = (b"<< /Type /Encoding /BaseEncoding /WinAnsiEncoding /Differences [128 "
+                 + " ".join("/" + name for _, name in EXTRA_GLYPHS).encode("ascii") + b"] >>")
+
+
+def _pdf_text(text):
+    text = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return text.translate(_PDF_CHARS).encode("latin-1", "replace")
+
+
+def column_widths(frame):
+    """Characters per column, gap included: the longest value and header word, at most ``MAX_COL_CHARS``."""
+    widths = []
+    for col in frame.columns:
+        series = frame[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.categories.astype(str)
+            longest = int(values.str.len().max()) if len(values) else 0
+        else:
+            longest = int(series.head(1000).astype(str).str.len().max()) if len(series) else 0
+        word = max(map(len, str(col).split()), default=0)
+        widths.append(min(max(longest, word, MIN_COL_CHARS), MAX_COL_CHARS) + 1)
+    return widths
+
+
+def column_groups(widths, total_chars):
+    """Indices of the consecutive columns printed on one page, each group at most ``total_chars`` wide."""
+    groups, used = [[]], 0
+    for i, width in enumerate(widths):
+        if groups[-1] and used + width > total_chars:
+            groups.append([])
+            used = 0
+        groups[-1].append(i)
+        used += width
+    return groups
+
+
+def _wrap(value, width):
+    if len(value) < width:
+        return [value]
+    return textwrap.wrap(value, width - 1, break_on_hyphens=False) or [""]
+
+
+class PdfTableWriter:
+    """Streams a text table into a PDF, one compressed page object at a time."""
+
+    def __init__(self, out, columns, widths, title=None, total_chars=None):
+        self.out = out
+        self.widths = widths
+        self.title = title
+        self.groups = column_groups(widths, total_chars or sum(widths))
+        self.offsets = {}  # object number -> byte offset
+        self.page_ids = []
+        self.next_id = 5  # 1 catalog, 2 page tree, 3-4 fonts
+        self.written = 0
+        self.block = []  # the rows of the current pages, as lines per column group
+        self.block_lines = 0
+        self.header = self._format([str(col) for col in columns])  # as tall in every group: rows line up
+        self.lines_per_page = (int((PAGE_HEIGHT - 2 * MARGIN) // LEADING) - len(self.header[0])
+                               - (2 if title else 1))
+
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding " + _PDF_ENCODING + b" >>")
+        self._object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier-Bold /Encoding " + _PDF_ENCODING + b" >>")
+
+    def _write(self, data):
+        self.out.write(data)
+        self.written += len(data)
+
+    def _object(self, obj_id, body):
+        self.offsets[obj_id] = self.written
+        self._write(b"%d 0 obj\n" % obj_id + body + b"\nendobj\n")
+
+    def _format(self, values):
+        """Lines of one row in each column group, the wrapped cells padded to the row's height."""
+        cells = [_wrap(value, width) for value, width in zip(values, self.widths)]
+        height = max(map(len, cells), default=1)
+        cells = [lines + [""] * (height - len(lines)) for lines in cells]
+        return [["".join(cells[i][k].ljust(self.widths[i]) for i in group).rstrip() for k in range(height)]
+                for group in self.groups]
+
+    def write_rows(self, rows):
+        for row in rows:
+            lines = self._format(row)
+            if self.block and self.block_lines + len(lines[0]) > self.lines_per_page:
+                self._flush_pages()
+            self.block.append(lines)
+            self.block_lines += len(lines[0])
+
+    def _flush_pages(self):
+        for g in range(len(self.groups)):
+            self._flush_page(self.header[g], [line for row in self.block for line in row[g]])
+        self.block = []
+        self.block_lines = 0
+
+    def _flush_page(self, header, lines):
+        top = PAGE_HEIGHT - MARGIN - FONT_SIZE
+        ops = [b"BT", b"%.2f TL" % LEADING, b"%d %.2f Td" % (MARGIN, top)]
+        if self.title:
+            ops += [b"/F2 %.1f Tf" % (FONT_SIZE + 2), b"(" + _pdf_text(self.title) + b") Tj T*"]
+        ops.append(b"/F2 %.1f Tf" % FONT_SIZE)
+        ops += [b"(" + _pdf_text(line) + b") Tj T*" for line in header]
+        ops.append(b"/F1 %.1f Tf" % FONT_SIZE)
+        ops += [b"(" + _pdf_text(line) + b") Tj T*" for line in lines]
+        ops.append(b"ET")
+        rule_y = top - LEADING * ((1 if self.title else 0) + len(header) - 0.3)
+        ops.append(b"0.4 w %d %.2f m %d %.2f l S" % (MARGIN, rule_y, PAGE_WIDTH - MARGIN, rule_y))
+        stream = zlib.compress(b"\n".join(ops))
+
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream)
+                     + stream + b"\nendstream")
+        self._object(page_id, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                     b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>"
+                     % (PAGE_WIDTH, PAGE_HEIGHT, content_id))
+        self.page_ids.append(page_id)
+
+    def close(self):
+        if self.block or not self.page_ids:
+            self._flush_pages()
+        kids = b" ".join(b"%d 0 R" % i for i in self.page_ids)
+        self._object(2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(self.page_ids))
+        xref_at = self.written
+        n = self.next_id
+        xref = [b"xref", b"0 %d" % n, b"0000000000 65535 f "]
+        xref += [b"%010d 00000 n " % self.offsets[i] for i in range(1, n)]
+        self._write(b"\n".join(xref) + b"\n")
+        self._write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (n, xref_at))
+
+
+def write_pdf(frame, out, title=None, chunk_rows=CHUNK_ROWS):
+    """Write ``frame`` as a paginated PDF table to the binary stream ``out``."""
+    total_chars = int((PAGE_WIDTH - 2 * MARGIN) / CHAR_WIDTH)
+    writer = PdfTableWriter(out, list(frame.columns), column_widths(frame), title, total_chars)
+    for start in range(0, len(frame), chunk_rows):
+        writer.write_rows(frame.iloc[start:start + chunk_rows].astype(str).to_numpy())
+    writer.close()
+
+
+def pdf_bytes(frame, title=None):
+    buf = io.BytesIO()
+    write_pdf(frame, buf, title)
+    return buf.getvalue()
+
+
+def view_export(view, fmt, cache=export_cache):
+    """``fmt`` bytes of a :class:`FilteredView`, built at most once per selection."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}, expected one of {list(EXPORT_FORMATS)}")
+    key = (view.key, fmt)
+    data = cache.get(key)
+    if data is None:
+        with section(f"export: {fmt}"):
+            data = csv_bytes(view.frame) if fmt == "csv" else pdf_bytes(view.frame)
+        if len(data) <= EXPORT_CACHE_MAX_FILE:
+            cache.put(key, data)
+    return data
+
+
+def deferred(view, fmt, cache=export_cache):
+    """Zero-argument callable for ``st.download_button(data=...)``: runs only on click."""
+    return lambda: view_export(view, fmt, cache)
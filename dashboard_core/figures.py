@@ -0,0 +1,81 @@
+"""Plotly figures cached apart from their theme and title.
+
+A figure is split in two.  The traces and the data-dependent layout (axes,
+legend, animation frames) depend only on the rows shown and on the chart's
+arguments.  They are built once per selection and kept, without a
+template or title, in the shared result cache.  The template and title
+are the skin: switching dark mode or the language re-applies them to the
+cached traces instead of rerunning Plotly Express over the rows.  A
+finished figure is also kept per (selection, template, title), so a rerun
+with nothing changed gets it back directly.
+
+Traces are always built with ``FIGURE_TEMPLATE``, whose colorway the
+light and dark themes share, so the marker colors do not depend on the
+theme a figure was first drawn with.
+"""
+
+import hashlib
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from .cache import LRUCache, shared_cache
+from .cube import SurveyCube
+from .filters import FilteredView
+from .profiling import section
+from .sampling import SAMPLE_SIZE, SAMPLE_THRESHOLD
+
+FIGURE_TEMPLATE = "plotly"
+
+# sampled charts depend on the sampling settings, which workers sharing the disk cache may not agree on
+trace_cache = shared_cache(f"figures-{SAMPLE_THRESHOLD}-{SAMPLE_SIZE}", maxsize=64)
+figure_cache = LRUCache(maxsize=64)
+
+
+def data_key(view, selection=None):
+    """Cache key of the data behind a chart: the selected rows, plus the selection for cube roll-ups."""
+    h = hashlib.sha1(view.key.encode())
+    for col, selected in sorted((selection or {}).items()):
+        h.update(repr((col, sorted(map(str, selected)))).encode())
+    return h.hexdigest()
+
+
+def _chart_id(build, args, kwargs):
+    # the data arguments are identified by the caller's key, every other argument is part of the id
+    options = [a for a in args if not isinstance(a, (pd.DataFrame, SurveyCube, FilteredView))]
+    return f"{build.__module__}.{build.__qualname__}:{options!r}:{sorted(kwargs.items())!r}"
+
+
+def cached_figure(key, build, *args, template=None, title=None, traces=trace_cache, figures=figure_cache, **kwargs):
+    """``build(*args, **kwargs)`` for the data identified by ``key``, skinned with ``template`` and ``title``.
+
+    Frames, cubes and views in ``args`` are the data and are not part of the cache key; the other
+    arguments are.  A :class:`FilteredView` is passed to ``build`` as its frame, materialized only
+    when the traces are not cached.  The returned figure is shared between reruns and must not be
+    modified.
+    """
+    chart = _chart_id(build, args, kwargs)
+    fig = figures.get((chart, key, template, title))
+    if fig is not None:
+        return fig
+    with section(f"figure: {title or build.__name__}"):
+        spec = traces.get((chart, key))
+        if spec is None:
+            args = [a.frame if isinstance(a, FilteredView) else a for a in args]
+            spec = build(*args, template=FIGURE_TEMPLATE, **kwargs).to_plotly_json()
+            spec["layout"].pop("template", None)
+            if spec["layout"].get("margin") == {"t": 60}:
+                # Plotly Express narrows the top margin of untitled figures: part of the skin
+                del spec["layout"]["margin"]
+            traces.put((chart, key), spec)
+        fig = go.Figure(spec)
+        if template is not None:
+            fig.update_layout(template=template)
+        if title is None:
+            fig.update_layout(margin_t=60)
+        else:
+            fig.update_layout(title_text=title)
+        # names untitled figures in the profile: the builder and its column arguments
+        fig._chart_name = " ".join([build.__name__, *(a for a in args if isinstance(a, str))])
+        figures.put((chart, key, template, title), fig)
+    return fig
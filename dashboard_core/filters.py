@@ -0,0 +1,134 @@
+"""Bitmap index over the sidebar filter columns.
+
+One packed bitmap (1 bit per row) is built per (column, value) at load
+time.  A filter selection is then an OR of the chosen bitmaps within a
+column and an AND across columns, instead of one ``isin`` scan per column
+on every rerun.  Rows appended to the survey only extend the bitmaps
+(:meth:`FilterIndex.extended`); the indexed rows are not scanned again.
+"""
+
+import copy
+import hashlib
+from functools import cached_property, reduce
+
+import numpy as np
+
+from .likert import encode_likert
+
+FILTER_COLUMNS = ["University", "Gender", "Year of Study"]
+
+
+class FilteredView:
+    """Rows selected by a filter; the frame is only materialized when asked for."""
+
+    def __init__(self, source, mask, n_rows, fingerprint=None, encoded=None):
+        self.source = source
+        self.mask = mask  # packed bitmap, or None when every row is selected
+        self.n_rows = n_rows
+        self.fingerprint = fingerprint
+        self.encoded = encoded  # LikertMatrix of every source row, if already built
+
+    @cached_property
+    def key(self):
+        """Stable digest of the selected row set, usable as a cache key across reruns."""
+        h = hashlib.sha1(f"{self.fingerprint}:{self.n_rows}:".encode())
+        h.update(b"all" if self.mask is None else self.mask.tobytes())
+        return h.hexdigest()
+
+    @cached_property
+    def rows(self):
+        if self.mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(self.mask, count=self.n_rows))
+
+    @cached_property
+    def frame(self):
+        if self.mask is None:
+            return self.source
+        return self.source.take(self.rows)
+
+    @cached_property
+    def likert(self):
+        """Ordinal Likert codes of the selected rows, taken from the source's matrix when there is one."""
+        if self.encoded is None:
+            return encode_likert(self.frame)
+        return self.encoded if self.mask is None else self.encoded.take(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+
+def _append_bits(packed, n_old, bits):
+    """Packed bitmap of ``n_old`` bits followed by the booleans ``bits``; only the last byte is repacked."""
+    full = n_old // 8
+    partial = np.unpackbits(packed[full:], count=n_old - full * 8).astype(bool)
+    return np.concatenate([packed[:full], np.packbits(np.concatenate([partial, bits]))])
+
+
+class FilterIndex:
+    def __init__(self, frame, columns=FILTER_COLUMNS, fingerprint=None):
+        self.frame = frame
+        self.fingerprint = fingerprint
+        self.columns = list(columns)
+        self.n_rows = 0
+        self.bitmaps = {col: {} for col in self.columns}
+        self._options = {col: [] for col in self.columns}
+        self._has_missing = dict.fromkeys(self.columns, False)
+        self._index_rows(frame)
+
+    def _index_rows(self, rows):
+        n_old = self.n_rows
+        for col in self.columns:
+            series = rows[col]
+            codes = series.cat.codes.to_numpy()
+            categories = series.cat.categories
+            self._has_missing[col] = self._has_missing[col] or bool((codes < 0).any())
+            bitmaps = self.bitmaps[col]
+            empty = np.zeros((n_old + 7) // 8, dtype=np.uint8)
+            for i, v in enumerate(categories):
+                bitmaps[v] = _append_bits(bitmaps.get(v, empty), n_old, codes == i)
+            # sidebar options keep first-appearance order, like Series.unique()
+            seen = codes[np.sort(np.unique(codes, return_index=True)[1])]
+            options = self._options[col]
+            options += [v for v in (categories[i] for i in seen if i >= 0) if v not in options]
+        self.n_rows = n_old + len(rows)
+
+    def extended(self, frame, fingerprint=None):
+        """Index of ``frame``, the indexed rows followed by appended ones; only the new rows are read.
+
+        The bitmaps are replaced rather than modified, so views of this index stay valid.
+        """
+        index = copy.copy(self)
+        index.frame = frame
+        index.fingerprint = fingerprint
+        index.bitmaps = {col: dict(b) for col, b in self.bitmaps.items()}
+        index._options = {col: list(o) for col, o in self._options.items()}
+        index._has_missing = dict(self._has_missing)
+        index._index_rows(frame.iloc[self.n_rows:])
+        return index
+
+    def values(self, col):
+        return list(self._options[col])
+
+    def mask(self, selection):
+        """Packed bitmap for ``{column: selected values}``; ``None`` means no row is excluded."""
+        result = None
+        for col, selected in selection.items():
+            bitmaps = self.bitmaps[col]
+            chosen = [bitmaps[v] for v in set(selected) if v in bitmaps]
+            # rows missing the column never match, as with isin(), so only then is the column a no-op
+            if len(chosen) == len(bitmaps) and not self._has_missing[col]:
+                continue
+            if chosen:
+                col_mask = reduce(np.bitwise_or, chosen)
+            else:
+                col_mask = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+            result = col_mask if result is None else result & col_mask
+        return result
+
+    def select(self, selection, encoded=None):
+        return FilteredView(self.frame, self.mask(selection), self.n_rows, self.fingerprint, encoded)
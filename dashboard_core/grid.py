@@ -0,0 +1,57 @@
+"""Server-side windows of the filtered rows for the raw-data table.
+
+The table shows one page of the selection at a time.  Only the rows of
+that page are taken from the store, and only for the columns on show, so
+what is serialized to the browser depends on the page size, not on the
+number of rows.  Sorting computes the display order of the selected rows
+once per (selection, column, direction) from the category codes and
+keeps it, so paging through a sorted table only slices that order.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache
+
+PAGE_SIZES = [25, 50, 100, 500]
+
+order_cache = LRUCache(maxsize=16)
+
+
+def sort_key(series):
+    """Float key sorting ``series`` by label (categoricals) or value; missing values are NaN."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        rank = np.empty(len(categories) + 1)
+        rank[np.argsort(categories.astype(str), kind="stable")] = np.arange(len(categories))
+        rank[-1] = np.nan  # code -1
+        return rank[series.cat.codes.to_numpy()]
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def sort_order(view, column, ascending=True, cache=order_cache):
+    """Positions in ``view.rows`` in display order; missing values last either way."""
+    key = (view.key, column, ascending)
+    order = cache.get(key)
+    if order is None:
+        series = view.source[column]
+        values = sort_key(series if view.mask is None else series.iloc[view.rows])
+        order = np.argsort(values if ascending else -values, kind="stable")
+        cache.put(key, order)
+    return order
+
+
+def page(view, number, size, columns=None, sort_by=None, ascending=True):
+    """Rows of page ``number`` (from 0) of ``view``, ``size`` per page, restricted to ``columns``."""
+    start = number * size
+    if sort_by is None:
+        positions = slice(start, start + size)
+    else:
+        positions = sort_order(view, sort_by, ascending)[start:start + size]
+    source = view.source
+    projection = slice(None) if columns is None else source.columns.get_indexer(list(columns))
+    return source.iloc[view.rows[positions], projection]
+
+
+def n_pages(view, size):
+    return max(1, -(-len(view) // size))
@@ -0,0 +1,107 @@
+"""Interface strings shared by the multilingual dashboards.
+
+A dashboard with its own wording passes it to :func:`strings` as
+``overrides`` (language -> key -> string); the keys it leaves out keep
+the shared strings.
+"""
+
+LANGUAGES = ["Français", "English", "Español", "Italiano", "中文"]
+LANGUAGE_LABEL = "🌐 Language / Langue / Idioma / 语言 / Lingua"
+
+TRANSLATIONS = {
+    "Français": {
+        "title": "📊 Analyse complète des étudiants à Ankara",
+        "filters": "🎛️ Filtres",
+        "students": "👨‍🎓 Total Étudiants",
+        "universities": "🏫 Universités",
+        "gpa": "🎯 GPA Moyen",
+        "ai": "🤖 Connaissance IA",
+        "animated": "📽️ Répartition genrée animée par année",
+        "bar": "GPA moyen par université et genre",
+        "violin": "Distribution GPA par année d'étude",
+        "clustering": "🧠 Regroupement des étudiants (GPA & IA)",
+        "summary": "📋 Résumé automatique par cluster",
+        "export": "📤 Exporter les données",
+        "download_csv": "⬇️ Télécharger CSV",
+        "download_pdf": "⬇️ Télécharger PDF",
+        "raw_data": "🔍 Données brutes",
+        "feedback": "📝 Donnez-nous votre avis !"
+    },
+    "English": {
+        "title": "📊 Comprehensive Student Analysis in Ankara",
+        "filters": "🎛️ Filters",
+        "students": "👨‍🎓 Total Students",
+        "universities": "🏫 Universities",
+        "gpa": "🎯 Average GPA",
+        "ai": "🤖 AI Knowledge",
+        "animated": "📽️ Animated Gender Distribution by Year",
+        "bar": "Average GPA by University and Gender",
+        "violin": "GPA Distribution by Study Year",
+        "clustering": "🧠 Student Clustering (GPA & AI)",
+        "summary": "📋 Cluster Summary",
+        "export": "📤 Export Data",
+        "download_csv": "⬇️ Download CSV",
+        "download_pdf": "⬇️ Download PDF",
+        "raw_data": "🔍 Raw Data",
+        "feedback": "📝 Leave your feedback!"
+    },
+    "Español": {
+        "title": "📊 Análisis completo de estudiantes en Ankara",
+        "filters": "🎛️ Filtros",
+        "students": "👨‍🎓 Total Estudiantes",
+        "universities": "🏫 Universidades",
+        "gpa": "🎯 Promedio GPA",
+        "ai": "🤖 Conocimiento en IA",
+        "animated": "📽️ Distribución de género animada por año",
+        "bar": "GPA promedio por universidad y género",
+        "violin": "Distribución de GPA por año de estudio",
+        "clustering": "🧠 Agrupamiento de estudiantes (GPA & IA)",
+        "summary": "📋 Resumen por grupo",
+        "export": "📤 Exportar datos",
+        "download_csv": "⬇️ Descargar CSV",
+        "download_pdf": "⬇️ Descargar PDF",
+        "raw_data": "🔍 Datos sin procesar",
+        "feedback": "📝 ¡Déjanos tu opinión!"
+    },
+    "Italiano": {
+        "title": "📊 Analisi completa degli studenti ad Ankara",
+        "filters": "🎛️ Filtri",
+        "students": "👨‍🎓 Studenti totali",
+        "universities": "🏫 Università",
+        "gpa": "🎯 GPA medio",
+        "ai": "🤖 Conoscenza IA",
+        "animated": "📽️ Distribuzione di genere animata per anno",
+        "bar": "GPA medio per università e genere",
+        "violin": "Distribuzione GPA per anno di studio",
+        "clustering": "🧠 Clustering degli studenti (GPA & IA)",
+        "summary": "📋 Riepilogo dei cluster",
+        "export": "📤 Esporta dati",
+        "download_csv": "⬇️ Scarica CSV",
+        "download_pdf": "⬇️ Scarica PDF",
+        "raw_data": "🔍 Dati grezzi",
+        "feedback": "📝 Lascia il tuo feedback!"
+    },
+    "中文": {
+        "title": "📊 安卡拉学生数据分析仪表盘",
+        "filters": "🎛️ 筛选条件",
+        "students": "👨‍🎓 学生总数",
+        "universities": "🏫 大学数量",
+        "gpa": "🎯 平均绩点",
+        "ai": "🤖 人工智能知识",
+        "animated": "📽️ 按年份划分的性别分布动画",
+        "bar": "按大学和性别划分的平均GPA",
+        "violin": "按学习年份划分的GPA分布",
+        "clustering": "🧠 学生聚类（GPA和AI）",
+        "summary": "📋 聚类摘要",
+        "export": "📤 导出数据",
+        "download_csv": "⬇️ 下载 CSV",
+        "download_pdf": "⬇️ 下载 PDF",
+        "raw_data": "🔍 原始数据",
+        "feedback": "📝 提交反馈意见"
+    }
+}
+
+
+def strings(lang, overrides=None):
+    """Strings of ``lang``: the shared ones, with an app's ``overrides[lang]`` laid over them."""
+    return {**TRANSLATIONS[lang], **(overrides or {}).get(lang, {})}
@@ -0,0 +1,212 @@
+"""Streamlit building blocks shared by the dashboard variants.
+
+Each variant script only arranges these sections; the survey, its indexes
+and every result cache live in the package, so all variants served by one
+Streamlit process share a single copy of the data.
+"""
+
+import os
+import sys
+
+import pandas as pd
+import streamlit as st
+
+from . import charts, export, figures, grid, profiling
+from .clustering import CLUSTER_ENGINES, FEATURE_SETS, K_RANGE, cluster_view, distinct_points, sweep_view
+from .dataset import SurveyDataset, open_data
+from .filters import FILTER_COLUMNS
+from .i18n import LANGUAGE_LABEL, LANGUAGES, TRANSLATIONS, strings
+
+ENGLISH = TRANSLATIONS["English"]
+ENGINE_HELP = ("auto = weighted fit on the distinct (GPA, AI) points; "
+               "streaming MiniBatchKMeans for large, high-cardinality data")
+FEATURES_HELP = "All survey items clusters on the ordinal codes of every Likert-style question"
+K_OPTIONS = ["auto", *K_RANGE]
+K_HELP = "auto = the k with the best silhouette over a sample of the selected students"
+# runs kept per session for the profiling panel's download
+PROFILE_HISTORY = 100
+
+
+def language_picker(label=LANGUAGE_LABEL, languages=LANGUAGES, overrides=None):
+    """Sidebar language selector; returns the strings of the chosen language, with the app's ``overrides``."""
+    lang = st.sidebar.selectbox(label, languages)
+    return strings(lang, overrides)
+
+
+def dark_mode_toggle(apply_css=True):
+    """Sidebar dark mode switch; returns the matching Plotly template."""
+    dark_mode = st.sidebar.toggle("🌙 Dark Mode", value=False)
+    if apply_css:
+        st.markdown(f"""
+    <style>
+        .main, .stApp {{
+            background-color: {'#1e1e1e' if dark_mode else '#f9fafb'};
+            color: {'white' if dark_mode else 'black'};
+        }}
+    </style>
+""", unsafe_allow_html=True)
+    return "plotly_dark" if dark_mode else "plotly_white"
+
+
+def profiling_panel():
+    """Admin sidebar panel with the section timings of the previous rerun, when ``DASHBOARD_PROFILE=1``.
+
+    Call it first: it starts profiling the rest of this rerun.
+    """
+    if os.environ.get("DASHBOARD_PROFILE", "0") != "1":
+        return None
+    state = st.session_state
+    previous = state.get("_profile_run")
+    history = state.setdefault("_profile_history", [])
+    if previous is not None:
+        profiling.append_log(previous)
+        history.append(previous.to_jsonl())
+        del history[:-PROFILE_HISTORY]
+
+    with st.sidebar.expander("⏱️ Profiling (previous rerun)"):
+        trace = st.toggle("Trace allocations (slower)", key="_profile_trace")
+        if previous is not None and previous.records:
+            table = pd.DataFrame(previous.records)
+            table["section"] = ["  " * d + name for d, name in zip(table["depth"], table["section"])]
+            st.dataframe(table.drop(columns="depth").round(1), hide_index=True, use_container_width=True)
+            st.caption(f"{previous.total('wall_ms'):.0f} ms wall, {previous.total('cpu_ms'):.0f} ms CPU")
+        st.download_button("Download JSON lines", lambda: "".join(history), "profile.jsonl", "application/x-ndjson",
+                           on_click="ignore", disabled=not history)
+
+    app = os.path.basename(getattr(sys.modules["__main__"], "__file__", "") or "") or None
+    state["_profile_run"] = profiling.start_run(app, trace_memory=trace, previous=previous)
+    return state["_profile_run"]
+
+
+@profiling.profiled("load data")
+def data_source(default):
+    """The survey to show: ``SURVEY_DATA`` (a CSV file or a partitioned directory), else ``default``.
+
+    A CSV is parsed once into a memory-mapped columnar cache shared by every session.
+    """
+    return open_data(os.environ.get("SURVEY_DATA", default))
+
+
+@profiling.profiled("load + filters")
+def sidebar_filters(source, header=ENGLISH["filters"], year_label="Year of Study"):
+    """University/Gender/Year multiselects; returns ``(survey, selection, view)``.
+
+    For a partitioned :class:`SurveyDataset` the partition columns are picked first and only the
+    matching partitions are loaded; the remaining filters then apply to the loaded rows.
+    """
+    labels = {"University": "University", "Gender": "Gender", "Year of Study": year_label}
+    st.sidebar.header(header)
+    partitions = {}
+    if isinstance(source, SurveyDataset):
+        for col in source.columns:
+            options = source.values(col)
+            partitions[col] = st.sidebar.multiselect(labels.get(col, col), options, default=options)
+        survey = source.load(partitions)
+    else:
+        survey = source
+
+    selection = {}
+    for col in FILTER_COLUMNS:
+        if col in partitions:
+            selection[col] = partitions[col]
+        else:
+            options = survey.values(col)
+            selection[col] = st.sidebar.multiselect(labels[col], options, default=options)
+    # Bitmap lookups instead of three isin() scans; rows are only copied when narrowed
+    return survey, selection, survey.select(selection)
+
+
+@profiling.profiled("kpis")
+def kpi_row(survey, selection, t=ENGLISH):
+    kpis = survey.cube.kpis(selection)  # rolled up from pre-aggregated cells
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(t["students"], kpis["students"])
+    col2.metric(t["universities"], kpis["universities"])
+    col3.metric(t["gpa"], kpis["gpa"])
+    col4.metric(t["ai"], kpis["ai"])
+    return kpis
+
+
+def plotly_chart(fig, **kwargs):
+    """``st.plotly_chart`` at container width, profiled as a section named after the figure.
+
+    The name is the figure's title, else the chart :func:`figures.cached_figure` built it with.
+    """
+    name = fig.layout.title.text or getattr(fig, "_chart_name", None) or (fig.data[0].type if fig.data else "figure")
+    with profiling.section(f"chart: {name}"):
+        return st.plotly_chart(fig, use_container_width=True, **kwargs)
+
+
+def _cluster_scatter(data, **kwargs):
+    # sampled per cluster on large selections
+    return charts.sampled_scatter(data, x="PC1", y="PC2", color="Cluster", **kwargs)
+
+
+@profiling.profiled("clustering")
+def cluster_section(view, summary_title=ENGLISH["summary"], template=None, title=None, ai_label="Avg AI"):
+    """Feature, engine and k pickers, PCA scatter of the clusters and a one-line summary per cluster.
+
+    With k on "auto", the elbow and silhouette curves of the k sweep are shown above the scatter.
+    A k above the number of distinct answer profiles in the selection is lowered to that number.
+    """
+    if view.empty:
+        return None
+    col1, col2, col3 = st.columns(3)
+    feature_set = col1.selectbox("🧩 Clustering features", list(FEATURE_SETS), help=FEATURES_HELP)
+    engine = col2.selectbox("⚙️ Clustering engine", CLUSTER_ENGINES, help=ENGINE_HELP)
+    k = col3.selectbox("🔢 Clusters", K_OPTIONS, index=K_OPTIONS.index(3), help=K_HELP)
+    features = FEATURE_SETS[feature_set]
+    n_points = distinct_points(view, features)
+    if n_points < 2:
+        st.warning("The selection has fewer than two distinct answer profiles to cluster; widen the filters.")
+        return None
+    if k == "auto":
+        # swept once per filter selection and feature set
+        sweep = sweep_view(view, random_state=42, features=features)
+        k = min(sweep.best_k, n_points)
+        if sweep.scores["silhouette"].notna().any():
+            st.caption(f"k = {k}: best sampled silhouette for k = {K_RANGE[0]}–{K_RANGE[-1]}")
+        else:
+            st.caption(f"k = {k}: the selection is too small to score k = {K_RANGE[0]}–{K_RANGE[-1]} by silhouette")
+        fig = figures.cached_figure(f"{view.key}:{feature_set}", charts.sweep_chart, sweep.scores, template=template)
+        plotly_chart(fig)
+    elif k > n_points:
+        st.warning(f"The selection has only {n_points} distinct answer profiles: showing {n_points} clusters, not {k}.")
+        k = n_points
+    # Fitted once per filter selection; other widgets reuse the cached result
+    clusters = cluster_view(view, n_clusters=k, random_state=42, engine=engine, features=features)
+    fig = figures.cached_figure(f"{view.key}:{engine}:{feature_set}:{k}", _cluster_scatter, clusters.data,
+                                title=title, template=template)
+    plotly_chart(fig)
+
+    st.markdown(summary_title)
+    for c in clusters.summary.itertuples():
+        st.write(f"🔹 Cluster {c.Cluster}: {c.students} students | Avg GPA: {c.avg_gpa:.2f} "
+                 f"| {ai_label}: {c.avg_ai:.2f}")
+    return clusters
+
+
+@profiling.profiled("export buttons")
+def export_buttons(view, t=ENGLISH, pdf=True):
+    # files are only generated when a button is clicked, then cached per filter selection
+    st.download_button(t["download_csv"], export.deferred(view, "csv"), "filtered_data.csv", "text/csv",
+                       on_click="ignore")
+    if pdf:
+        st.download_button(t["download_pdf"], export.deferred(view, "pdf"), "filtered_data.pdf", "application/pdf",
+                           on_click="ignore")
+
+
+@profiling.profiled("raw table")
+def raw_data(view):
+    """One page of the selected rows, sorted and projected on the server; only that page is sent."""
+    columns = list(view.source.columns)
+    shown = st.multiselect("Columns", columns, default=columns)
+    col1, col2, col3, col4 = st.columns(4)
+    sort_by = col1.selectbox("Sort by", [None, *shown], format_func=lambda c: "File order" if c is None else c)
+    descending = col2.toggle("Descending", disabled=sort_by is None)
+    size = col3.selectbox("Rows per page", grid.PAGE_SIZES)
+    n_pages = grid.n_pages(view, size)
+    number = col4.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1)
+    st.dataframe(grid.page(view, number - 1, size, shown, sort_by, not descending), use_container_width=True)
+    start = (number - 1) * size
+    st.caption(f"Rows {min(start + 1, len(view))}–{min(start + size, len(view))} of {len(view)}")
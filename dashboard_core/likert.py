@@ -0,0 +1,86 @@
+"""Ordinal codes of the survey's Likert-style answers.
+
+``LIKERT_SCHEMA`` lists the answers of each ordered question from lowest
+to highest.  :func:`encode_likert` turns those columns into one
+contiguous ``int8`` matrix, one row per respondent.  Each column's
+categories are ranked once and the rows only index that small lookup
+table.  Codes come from the schema, not from the answers present, so they
+are the same for every file, filter selection and append.  Missing
+answers and answers the schema does not list are ``MISSING``.
+
+The store encodes its frame once (``SurveyStore.likert``) and filtered
+views take their rows from that matrix, so numeric analyses read
+ready-made codes on every rerun.
+"""
+
+import numpy as np
+import pandas as pd
+
+MISSING = -1
+
+AGREE = ["Disagree", "Partially agree", "Agree"]
+YES_NO = ["No", "Yes"]
+
+LIKERT_SCHEMA = {
+    "GPA": ["2.00 or below", "2.01 - 2.50", "2.51 - 3.00", "3.01 - 3.50", "3.51 - 4.00"],
+    "Internship Experience": YES_NO,
+    "AI and Automation Knowledge Level": ["No knowledge", "Little knowledge", "Moderate knowledge", "High knowledge"],
+    "Impact of AI on Career Plans": YES_NO,
+    "Impact of AI on Job Opportunities": ["Negative impact", "No impact", "Positive impact"],
+    "Concern Level": ["Not concerned", "Slightly concerned", "Moderately concerned", "Highly concerned"],
+    "Anxiety Level": ["No anxiety", "Slight anxiety", "Moderate anxiety", "High anxiety"],
+    "If I Studied Engineering, I Would Feel More Resilient to AI Impacts": AGREE,
+    "Math Courses Help Understand AI": AGREE,
+    "Statistics Curriculum Helps Adapt": AGREE,
+    "Satisfaction with Studying Statistics": ["Not satisfied", "Slightly satisfied", "Moderate satisfaction",
+                                              "Satisfied", "Highly satisfied"],
+    "Education Prepares for AI Field": AGREE,
+    "Future Focus on AI and Automation": YES_NO,
+    "Research Opportunities at University": YES_NO,
+    "AI Influence on Choosing Statistics": ["No influence", "Slight influence", "Moderate influence", "High influence"],
+    "Difficulties in Internship Interviews": ["No", "Partially", "Yes"],
+}
+
+
+def encode_column(series, levels):
+    """``int8`` rank of each value of ``series`` in ``levels``."""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype("category")
+    rank = {v: i for i, v in enumerate(levels)}
+    # trailing slot: category code -1 (missing) indexes it
+    lookup = np.array([rank.get(str(c), MISSING) for c in series.cat.categories] + [MISSING], dtype=np.int8)
+    return lookup[series.cat.codes.to_numpy()]
+
+
+class LikertMatrix:
+    """Ordinal codes of the Likert columns, ``codes[row, column]``."""
+
+    def __init__(self, codes, columns):
+        self.codes = codes
+        self.columns = list(columns)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def column(self, name):
+        return self.codes[:, self.columns.index(name)]
+
+    def take(self, rows):
+        return LikertMatrix(self.codes[rows], self.columns)
+
+    def extended(self, rows):
+        """Matrix of these rows followed by the frame ``rows``, of which only the new rows are encoded."""
+        added = encode_likert(rows, {col: LIKERT_SCHEMA[col] for col in self.columns})
+        return LikertMatrix(np.concatenate([self.codes, added.codes]), self.columns)
+
+    def to_frame(self, index=None):
+        return pd.DataFrame(self.codes, columns=self.columns, index=index)
+
+
+def encode_likert(frame, schema=LIKERT_SCHEMA):
+    """:class:`LikertMatrix` of the columns of ``schema`` found in ``frame``."""
+    columns = [col for col in schema if col in frame.columns]
+    codes = np.empty((len(frame), len(columns)), dtype=np.int8)
+    for j, col in enumerate(columns):
+        codes[:, j] = encode_column(frame[col], schema[col])
+    return LikertMatrix(codes, columns)
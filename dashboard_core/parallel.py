@@ -0,0 +1,123 @@
+"""Cube builds split across a process pool.
+
+The frame's columns are dumped as ``.npy`` buffers: category codes plus
+``GPA_Numeric``, with the category labels in ``columns.json``.  Workers
+open those buffers with ``np.load(mmap_mode="r")``, so only shard bounds
+and the small partial cubes cross process boundaries, never the frame.
+Each worker reduces its row range to a :class:`SurveyCube`.  The partials
+are merged by label, exactly as the chunked path merges batches.  The
+buffers are written to a private temporary directory (``mkdtemp``, mode
+0700) that is removed once the cube is built; the cube itself is cached
+per survey fingerprint by the store.
+
+Workers are spawned, not forked.  A spawned worker runs the parent's
+``__main__`` file again, and under Streamlit that is the app script, so
+``__main__`` is swapped for an empty module while shards are submitted.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+from .cube import SurveyCube
+from .filters import FILTER_COLUMNS
+
+# SurveyStore.cube builds in parallel from this many rows, when there is more than one worker
+PARALLEL_THRESHOLD = 2_000_000
+
+_pool = None
+_pool_workers = 0
+_lock = threading.Lock()
+
+
+def default_workers():
+    return int(os.environ.get("SURVEY_WORKERS", 0)) or os.cpu_count() or 1
+
+
+def export_columns(frame, directory):
+    """Write the categorical codes and numeric columns of ``frame`` as ``.npy`` buffers into ``directory``."""
+    columns = []
+    for i, col in enumerate(frame.columns):
+        series = frame[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            np.save(os.path.join(directory, f"{i}.npy"), series.cat.codes.to_numpy())
+            columns.append({"name": col, "categories": [str(c) for c in series.cat.categories]})
+        else:
+            np.save(os.path.join(directory, f"{i}.npy"), series.to_numpy())
+            columns.append({"name": col})
+    with open(os.path.join(directory, "columns.json"), "w") as f:
+        json.dump({"n_rows": len(frame), "columns": columns}, f)
+    return directory
+
+
+def open_columns(directory, start=0, stop=None):
+    """Rows ``start:stop`` of exported columns as a frame; categoricals wrap the memory-mapped codes."""
+    with open(os.path.join(directory, "columns.json")) as f:
+        meta = json.load(f)
+    data = {}
+    for i, col in enumerate(meta["columns"]):
+        values = np.load(os.path.join(directory, f"{i}.npy"), mmap_mode="r")[start:stop]
+        if "categories" in col:
+            data[col["name"]] = pd.Categorical.from_codes(values, col["categories"], validate=False)
+        else:
+            data[col["name"]] = values
+    return pd.DataFrame(data)
+
+
+def _partial_cube(directory, start, stop, dims):
+    return SurveyCube.from_frame(open_columns(directory, start, stop), dims)
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # spawn: forking the Streamlit server process would copy its threads' locks
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def build_cube(frame, workers=None, shards=None, dims=FILTER_COLUMNS):
+    """:class:`SurveyCube` of ``frame`` built by ``workers`` processes over ``shards`` row ranges."""
+    if len(frame) == 0:
+        return SurveyCube.from_frame(frame, dims)
+    directory = tempfile.mkdtemp(prefix="survey-columns-")
+    try:
+        export_columns(frame, directory)
+        return cube_of_columns(directory, len(frame), workers, shards, dims)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def cube_of_columns(directory, n_rows, workers=None, shards=None, dims=FILTER_COLUMNS):
+    """:class:`SurveyCube` of the ``n_rows`` rows exported to ``directory``, reduced shard by shard."""
+    workers = workers or default_workers()
+    shards = shards or workers
+    bounds = np.linspace(0, n_rows, shards + 1).astype(np.int64)
+    ranges = [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    if workers == 1:
+        partials = [_partial_cube(directory, a, b, dims) for a, b in ranges]
+    else:
+        pool = _get_pool(workers)
+        with _lock:
+            # map() submits every shard, and so starts the workers, before returning
+            main, sys.modules["__main__"] = sys.modules["__main__"], types.ModuleType("__main__")
+            try:
+                results = pool.map(_partial_cube, *zip(*((directory, a, b, dims) for a, b in ranges)))
+            finally:
+                sys.modules["__main__"] = main
+        partials = list(results)
+    return reduce(SurveyCube.merge, partials)
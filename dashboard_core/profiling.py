@@ -0,0 +1,160 @@
+"""Per-section timings of a dashboard rerun.
+
+``start_run()`` attaches a :class:`Profiler` to the thread running the
+script, and every ``with section(name):`` block inside it records its wall
+time, CPU time and, while tracemalloc is tracing, the memory it allocated
+(peak above the level it started from) and kept (net change).  Outside a
+profiled run ``section`` does nothing, so the instrumented layout code
+costs next to nothing when profiling is off.
+
+CPU time and traced memory are process-wide: threads started by the
+section (the k sweep, sklearn's OpenMP pool) are counted, and so is any
+other session rendering at the same time.  For the same reason tracemalloc
+is only stopped once no run asks for it any more, and never when it was
+started by someone else (``python -X tracemalloc``, a benchmark).
+
+Every dashboard calls ``layout.profiling_panel()`` first.  It does nothing
+unless the server runs with ``DASHBOARD_PROFILE=1``; then every rerun is
+profiled and an admin panel in the sidebar shows the timings of the
+previous one.
+
+Runs are exported as JSON lines, one record per section, and appended to
+``DASHBOARD_PROFILE_LOG`` when it is set, so hot paths can be compared
+across releases.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+PROFILE_LOG = os.environ.get("DASHBOARD_PROFILE_LOG")
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_trace_lock = threading.Lock()
+_tracing_runs = weakref.WeakSet()  # profilers of the runs that asked for tracemalloc
+_started_tracing = False  # whether tracemalloc was started here
+
+
+class Profiler:
+    def __init__(self, app=None):
+        self.app = app
+        self.started = time.time()
+        self.records = []
+        self._peaks = []  # highest traced memory seen by the children of each open section
+
+    @contextmanager
+    def section(self, name):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            base, peak_so_far = tracemalloc.get_traced_memory()
+            if self._peaks:
+                # the enclosing section's peak is about to be reset
+                self._peaks[-1] = max(self._peaks[-1], peak_so_far)
+            tracemalloc.reset_peak()
+        # recorded in start order, nested sections after their parent
+        record = {"section": name, "depth": len(self._peaks)}
+        self.records.append(record)
+        self._peaks.append(0)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall) * 1000
+            record["cpu_ms"] = (time.process_time() - cpu) * 1000
+            peak = self._peaks.pop()
+            if tracing:
+                current, own_peak = tracemalloc.get_traced_memory()
+                # nested sections reset the peak: keep the highest one seen before them
+                peak = max(peak, own_peak)
+                record["alloc_kb"] = (peak - base) / 1024
+                record["net_kb"] = (current - base) / 1024
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+
+    def total(self, key):
+        """Sum of ``key`` over the outermost sections."""
+        return sum(r.get(key, 0) for r in self.records if r["depth"] == 0)
+
+    def to_jsonl(self, **fields):
+        """One JSON object per section, with the run's app and start time and ``fields``."""
+        meta = {"app": self.app, "started": self.started, **fields}
+        return "".join(json.dumps({**meta, **r}) + "\n" for r in self.records)
+
+
+def start_run(app=None, trace_memory=False, previous=None):
+    """Profile the rest of this thread's run, replacing ``previous`` (default: this thread's profiler).
+
+    Returns the new profiler.  With ``trace_memory`` tracemalloc is started if it is not tracing yet.
+    """
+    global _started_tracing
+    previous = previous or current()
+    profiler = Profiler(app)
+    with _trace_lock:
+        if previous is not None:
+            _tracing_runs.discard(previous)
+        if trace_memory:
+            _tracing_runs.add(profiler)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+        else:
+            _release_tracing()
+    _local.profiler = profiler
+    return profiler
+
+
+def stop_run():
+    """Detach this thread's profiler; tracemalloc is stopped if it was started here and no other run needs it."""
+    with _trace_lock:
+        profiler = current()
+        if profiler is not None:
+            _tracing_runs.discard(profiler)
+        _release_tracing()
+    _local.profiler = None
+
+
+def _release_tracing():
+    global _started_tracing
+    if _started_tracing and not _tracing_runs:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        _started_tracing = False
+
+
+def current():
+    return getattr(_local, "profiler", None)
+
+
+@contextmanager
+def section(name):
+    profiler = current()
+    if profiler is None:
+        yield
+        return
+    with profiler.section(name):
+        yield
+
+
+def profiled(name):
+    """Decorator running the function inside ``section(name)``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def append_log(profiler, path=PROFILE_LOG, **fields):
+    """Append a finished run to the JSON lines file ``path`` (nothing without a path)."""
+    if not path or not profiler.records:
+        return
+    with _log_lock, open(path, "a") as f:
+        f.write(profiler.to_jsonl(**fields))
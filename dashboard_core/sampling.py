@@ -0,0 +1,115 @@
+"""Row reductions for the charts that would otherwise plot every respondent.
+
+Scatter plots above ``SAMPLE_THRESHOLD`` rows show a stratified sample of
+``SAMPLE_SIZE`` points.  Every stratum (e.g. each Gender × Year of Study
+group, or each cluster) keeps its share of the rows, and within a stratum
+the rows are drawn uniformly without replacement, which is the sample a
+reservoir over that stratum's rows would hold.  The generator is seeded,
+so a selection always gets the same points, whichever process draws them.
+
+Violins above the threshold are drawn from densities estimated here
+instead of sending every value to the browser: the Gaussian KDE of each
+group is computed over its distinct values (or a fine histogram when
+there are many), weighted by their counts, so its cost depends on the
+number of distinct values and not on the number of rows.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_THRESHOLD = int(os.environ.get("DASHBOARD_SAMPLE_THRESHOLD", 20_000))
+SAMPLE_SIZE = 5_000
+KDE_POINTS = 100
+# values beyond this many distinct ones are binned before the KDE
+KDE_MAX_VALUES = 512
+
+
+def allocate(counts, size):
+    """Integer share of ``size`` for each stratum, proportional to ``counts`` (largest remainders)."""
+    counts = np.asarray(counts)
+    exact = counts * (size / counts.sum())
+    quotas = np.floor(exact).astype(np.int64)
+    short = size - quotas.sum()
+    quotas[np.argsort(quotas - exact, kind="stable")[:short]] += 1
+    return np.minimum(quotas, counts)
+
+
+def stratified_sample(frame, strata, size=SAMPLE_SIZE, seed=0):
+    """Sorted positions of ``size`` rows of ``frame``, each group of ``strata`` keeping its share."""
+    n = len(frame)
+    if n <= size:
+        return np.arange(n)
+    if strata:
+        groups = frame.groupby(list(strata), observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        groups = np.zeros(n, dtype=np.int64)
+    order = np.argsort(groups, kind="stable")
+    counts = np.bincount(groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rng = np.random.default_rng(seed)
+    picked = [order[start + rng.choice(count, quota, replace=False)]
+              for start, count, quota in zip(starts, counts, allocate(counts, size)) if quota]
+    return np.sort(np.concatenate(picked))
+
+
+def sample_note(shown, total, strata=()):
+    by = f", stratified by {' × '.join(strata)}" if strata else ""
+    return f"Showing {shown:,} of {total:,} points ({shown / total:.1%} sample{by})"
+
+
+def value_counts(values):
+    """Distinct values and their counts, binned into ``KDE_MAX_VALUES`` bins when there are more."""
+    values = values[~np.isnan(values)]
+    points, counts = np.unique(values, return_counts=True)
+    if len(points) > KDE_MAX_VALUES:
+        counts, edges = np.histogram(values, bins=KDE_MAX_VALUES)
+        points = (edges[:-1] + edges[1:]) / 2
+    return points, counts
+
+
+def weighted_quantiles(points, weights, q):
+    """Quantiles ``q`` of values ``points`` (sorted) repeated ``weights`` times, interpolated like NumPy's."""
+    cum = np.cumsum(weights)
+    positions = np.asarray(q) * (cum[-1] - 1)
+    lower = points[np.searchsorted(cum, np.floor(positions), side="right")]
+    upper = points[np.searchsorted(cum, np.ceil(positions), side="right")]
+    return lower + (upper - lower) * (positions - np.floor(positions))
+
+
+def bandwidth(points, weights):
+    """Silverman's rule of thumb, the default of Plotly's violins."""
+    n = weights.sum()
+    mean = np.average(points, weights=weights)
+    std = np.sqrt(np.average((points - mean) ** 2, weights=weights))
+    q1, q3 = weighted_quantiles(points, weights, [0.25, 0.75])
+    spread = min(std, (q3 - q1) / 1.349) or std
+    return 1.059 * spread * n ** -0.2 or 1e-3
+
+
+def kde(points, weights, n_points=KDE_POINTS):
+    """``(grid, density)`` of the weighted Gaussian KDE, over the data range plus two bandwidths."""
+    bw = bandwidth(points, weights)
+    grid = np.linspace(points[0] - 2 * bw, points[-1] + 2 * bw, n_points)
+    z = (grid[:, None] - points[None, :]) / bw
+    density = np.exp(-0.5 * z ** 2) @ weights / (weights.sum() * bw * np.sqrt(2 * np.pi))
+    return grid, density
+
+
+def group_values(frame, y, by):
+    """``{group labels: (distinct values, counts)}`` of column ``y`` for each group of ``by`` with values."""
+    out = {}
+    for labels, rows in frame.groupby(by, observed=True, sort=True)[y]:
+        points, counts = value_counts(rows.to_numpy(dtype=np.float64))
+        if len(points):
+            out[labels if isinstance(labels, tuple) else (labels,)] = (points, counts)
+    return out
+
+
+def category_order(series):
+    """Labels of ``series`` in the order its categories (or sorted values) give."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        present = set(series.unique())
+        return [c for c in series.cat.categories if c in present]
+    return sorted(series.dropna().unique())
@@ -0,0 +1,332 @@
+"""Columnar survey store.
+
+The survey CSV is parsed once into dictionary-encoded columns and written to an
+Arrow IPC file next to it.  Later loads memory-map that file instead of
+parsing the CSV again; the cache is rebuilt only when the CSV changes.
+
+Responses are collected continuously, so the CSV usually changes by
+growing.  The store remembers the byte offset it has consumed and a digest
+of the bytes just before it; when the file still holds those bytes at that
+offset, only the complete lines after it are parsed and the frame, the
+filter index, the cube and the Likert codes are extended with them.  Appended lines must
+end with a newline; a partially written last line is picked up on the
+next load.
+
+When the cache cannot be written (a read-only data directory, a full
+disk), the error is logged and the parsed survey is used without it.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from pandas.api.types import union_categoricals
+
+from .cache import shared_cache
+from .cube import SurveyCube
+from .filters import FilterIndex
+from .likert import encode_likert
+from .parallel import PARALLEL_THRESHOLD, build_cube, default_workers
+
+DATA_FILE = "Statistics_Undergraduate_Programs_Ankara.csv"
+CACHE_DIR = ".survey_cache"
+CACHE_VERSION = "2"
+# bytes before the consumed offset that must be unchanged for the file to count as appended to
+WINDOW_BYTES = 1 << 16
+# the Arrow cache is rewritten once the rows parsed since it was written reach this share of it
+CACHE_REWRITE_RATIO = 0.25
+
+GPA_POINTS = {
+    "2.00 or below": 1.75,
+    "2.01 - 2.50": 2.25,
+    "2.51 - 3.00": 2.75,
+    "3.01 - 3.50": 3.25,
+    "3.51 - 4.00": 3.75
+}
+
+_stores = {}
+_lock = threading.Lock()
+logger = logging.getLogger(__name__)
+cube_cache = shared_cache("cubes", maxsize=8)
+
+
+def cache_path_for(path, cache_dir=None):
+    path = os.path.abspath(path)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(path), CACHE_DIR)
+    return os.path.join(cache_dir, os.path.basename(path) + ".arrow")
+
+
+def add_gpa_numeric(df):
+    """Add ``GPA_Numeric`` from the categorical ``GPA`` column without a per-row map."""
+    gpa = df["GPA"]
+    if not isinstance(gpa.dtype, pd.CategoricalDtype):
+        gpa = gpa.astype("category")
+    points = np.array([GPA_POINTS.get(c, np.nan) for c in gpa.cat.categories] + [np.nan], dtype="float32")
+    # code -1 (missing) picks the trailing NaN
+    df["GPA_Numeric"] = points[gpa.cat.codes.to_numpy()]
+    return df
+
+
+def parse_csv(path):
+    """Parse the survey CSV straight into categoricals (every survey column is a label)."""
+    return add_gpa_numeric(pd.read_csv(path, dtype="category"))
+
+
+def window_digest(path, offset):
+    """Digest of the ``WINDOW_BYTES`` ending at ``offset``, or ``None`` if the file is shorter."""
+    start = max(0, offset - WINDOW_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(offset - start)
+    return hashlib.sha256(data).hexdigest() if len(data) == offset - start else None
+
+
+def read_tail(path, offset):
+    """Complete lines written after ``offset``, and the offset following them."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    return data[:end], offset + end
+
+
+def parse_rows(data, columns):
+    """Parse headerless CSV lines with the survey's ``columns``."""
+    return add_gpa_numeric(pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype="category"))
+
+
+def concat_frames(frames):
+    """Frames one after the other, categoricals merged into sorted categories as a full parse gives."""
+    first = frames[0]
+    out = {}
+    for col in first.columns:
+        if isinstance(first[col].dtype, pd.CategoricalDtype):
+            dtype = first[col].cat.categories.dtype
+            parts = []
+            for frame in frames:
+                part = frame[col]
+                if part.cat.categories.dtype != dtype:
+                    # a column left empty in every row parses with object categories
+                    part = part.cat.set_categories(part.cat.categories.astype(dtype))
+                parts.append(part)
+            out[col] = union_categoricals(parts, sort_categories=True)
+        else:
+            out[col] = np.concatenate([frame[col].to_numpy() for frame in frames])
+    return pd.DataFrame(out)
+
+
+def _write_cache(table, cache_path, meta):
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        **{k.encode(): str(v).encode() for k, v in meta.items()},
+    })
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, cache_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_cache(cache_path):
+    """Memory-map the cache; returns ``(table, meta)`` or ``(None, {})``."""
+    try:
+        source = pa.memory_map(cache_path, "r")
+        table = ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None, {}
+    meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+    if meta.get("cache_version") != CACHE_VERSION:
+        return None, {}
+    return table, meta
+
+
+class SurveyStore:
+    """A loaded survey: the frame, the fingerprint of its file and its lazily built indexes."""
+
+    def __init__(self, frame, source=None, fingerprint=None, offset=None, window=None, cache_offset=None,
+                 digest=None):
+        self.frame = frame
+        self.source = source
+        self.fingerprint = fingerprint
+        self.digest = digest if digest is not None else fingerprint  # sha256 of the file at its last full parse
+        self.offset = offset  # bytes of the file consumed so far
+        self.window = window  # window_digest(source, offset)
+        self.cache_offset = cache_offset  # offset the Arrow cache was written at
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def columns(self):
+        return self.frame.columns
+
+    @property
+    def csv_columns(self):
+        return [c for c in self.frame.columns if c != "GPA_Numeric"]
+
+    @cached_property
+    def index(self):
+        return FilterIndex(self.frame, fingerprint=self.fingerprint)
+
+    @cached_property
+    def cube(self):
+        cube = None if self.fingerprint is None else cube_cache.get(self.fingerprint)
+        if cube is None:
+            cube = self._build_cube()
+            if self.fingerprint is not None:
+                cube_cache.put(self.fingerprint, cube)
+        return cube
+
+    def _build_cube(self):
+        if len(self.frame) >= PARALLEL_THRESHOLD and default_workers() > 1:
+            return build_cube(self.frame)
+        return SurveyCube.from_frame(self.frame)
+
+    @cached_property
+    def likert(self):
+        return encode_likert(self.frame)
+
+    def values(self, col):
+        """Sidebar options of the filter column ``col``."""
+        return self.index.values(col)
+
+    def select(self, selection):
+        """:class:`FilteredView` of ``selection``, carrying this store's Likert codes."""
+        return self.index.select(selection, self.likert)
+
+    def appended(self, rows, **state):
+        """New store with ``rows`` added; an index, cube or Likert matrix already built is extended, not rebuilt."""
+        frame = concat_frames([self.frame, rows])
+        store = SurveyStore(frame, self.source, **{"cache_offset": self.cache_offset, "digest": self.digest, **state})
+        if "index" in self.__dict__:
+            store.index = self.index.extended(frame, store.fingerprint)
+        if "cube" in self.__dict__:
+            store.cube = self.cube.merge(SurveyCube.from_frame(rows))
+        if "likert" in self.__dict__:
+            store.likert = self.likert.extended(rows)
+        return store
+
+
+def _stamp(path):
+    info = os.stat(path)
+    return {"mtime_ns": str(info.st_mtime_ns), "size": str(info.st_size)}
+
+
+def _save(store, cache_path, stamp):
+    table = pa.Table.from_pandas(store.frame, preserve_index=False)
+    try:
+        _write_cache(table, cache_path, {"cache_version": CACHE_VERSION, "sha256": store.digest,
+                                         "fingerprint": store.fingerprint,
+                                         "offset": store.offset, "window": store.window, **stamp})
+    except OSError as e:
+        logger.warning("survey cache %s not written: %s", cache_path, e)
+    # also after a failed write, so appends do not retry it on every load
+    store.cache_offset = store.offset
+
+
+def _is_append(path, offset, window):
+    """Whether ``path`` grew past ``offset`` with the bytes just before it unchanged.
+
+    A file of the same size or shorter was edited or truncated, not appended to: it is hashed again.
+    """
+    return (offset is not None and window is not None and os.path.getsize(path) > offset
+            and window_digest(path, offset) == window)
+
+
+def _extend(store, path, cache_path, stamp):
+    """Parse only the lines appended to ``path`` since ``store`` was loaded."""
+    data, offset = read_tail(path, store.offset)
+    if not data:
+        return store
+    rows = parse_rows(data, store.csv_columns)
+    window = window_digest(path, offset)
+    # names the file content without rehashing it: the same for every process whatever batches it read
+    fingerprint = hashlib.sha256(f"{store.digest}:{offset}:{window}".encode()).hexdigest()
+    store = store.appended(rows, fingerprint=fingerprint, offset=offset, window=window)
+    if offset - store.cache_offset >= CACHE_REWRITE_RATIO * store.cache_offset:
+        _save(store, cache_path, stamp)
+    return store
+
+
+def _load(path, cache_dir=None, previous=None):
+    source = os.path.abspath(path)
+    cache_path = cache_path_for(path, cache_dir)
+    stamp = _stamp(path)
+    if previous is not None and _is_append(path, previous.offset, previous.window):
+        return _extend(previous, path, cache_path, stamp)
+
+    table, meta = _read_cache(cache_path)
+    if table is not None:
+        offset = int(meta["offset"])
+        fresh = all(meta.get(k) == v for k, v in stamp.items())
+        if fresh or _is_append(path, offset, meta["window"]):
+            store = SurveyStore(table.to_pandas(split_blocks=True), source, meta["fingerprint"],
+                                offset, meta["window"], cache_offset=offset, digest=meta["sha256"])
+            return store if fresh else _extend(store, path, cache_path, stamp)
+
+    # read once, so the digest, the parsed rows and the offset describe the same bytes
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if table is None or meta.get("fingerprint") != digest:
+        table = pa.Table.from_pandas(parse_csv(io.BytesIO(data)), preserve_index=False)
+    offset = len(data)
+    window = hashlib.sha256(data[max(0, offset - WINDOW_BYTES):]).hexdigest()
+    store = SurveyStore(table.to_pandas(split_blocks=True), source, digest, offset, window)
+    # rewritten also when only the mtime moved, so the next load skips the hash
+    _save(store, cache_path, stamp)
+    return store
+
+
+def read_survey(path, cache_dir=None):
+    """Load ``path`` through its Arrow cache, without keeping it in the registry of :func:`open_survey`."""
+    return _load(path, cache_dir)
+
+
+def open_survey(path=DATA_FILE, cache_dir=None):
+    """Return the shared :class:`SurveyStore` for ``path``, reloading only if the file changed.
+
+    A file that only grew is not reloaded: the rows appended to it are parsed and added.
+    """
+    key = os.path.abspath(path)
+    info = os.stat(path)
+    stamp = (info.st_mtime_ns, info.st_size)
+    with _lock:
+        cached = _stores.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _load(path, cache_dir, previous=cached[1] if cached else None))
+            _stores[key] = cached
+        return cached[1]
+
+
+def append_responses(rows, path=DATA_FILE):
+    """Append survey responses (a frame with the survey's columns) to the CSV as complete lines."""
+    columns = list(pd.read_csv(path, nrows=0).columns)
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+        last = f.read(1)
+    with open(path, "ab") as f:
+        if last and last != b"\n":
+            f.write(b"\r\n")
+        f.write(rows[columns].to_csv(header=False, index=False, lineterminator="\r\n").encode("utf-8"))
+
+
+def load_survey(path=DATA_FILE, cache_dir=None):
+    """Survey frame with categorical label columns and a precomputed ``GPA_Numeric``.
+
+    The frame is shared between callers and must not be modified in place.
+    """
+    return open_survey(path, cache_dir).frame
@@ -0,0 +1,43 @@
+"""Optional background import of the modules a section loads on first use.
+
+The clustering section imports scikit-learn lazily, so a cold start does
+not pay for it up front.  ``warm_up()`` imports those modules in a daemon
+thread once the first screen has been sent, so they are usually loaded by
+the time a user scrolls to the section.  Set ``DASHBOARD_WARMUP=0`` to
+turn this off; the section then imports them itself when it first renders.
+"""
+
+import importlib
+import os
+import threading
+
+SECTION_MODULES = {
+    "clustering": ["sklearn.cluster", "sklearn.decomposition", "sklearn.metrics", "sklearn.preprocessing"],
+}
+
+_started = set()
+_lock = threading.Lock()
+
+
+def _import_all(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # the section reports the missing dependency when it renders
+            return
+
+
+def warm_up(*sections):
+    """Start importing the modules of ``sections`` (default: all) in the background, once per process."""
+    if os.environ.get("DASHBOARD_WARMUP", "1") == "0":
+        return None
+    with _lock:
+        pending = [s for s in (sections or SECTION_MODULES) if s not in _started]
+        _started.update(pending)
+    if not pending:
+        return None
+    modules = [m for s in pending for m in SECTION_MODULES[s]]
+    thread = threading.Thread(target=_import_all, args=(modules,), name="dashboard-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,93 @@
+import os
+import pickle
+import stat
+from types import SimpleNamespace
+
+from dashboard_core import cache as cache_module
+from dashboard_core.cache import RESULT_CACHE_PATH, DiskCache, LRUCache
+
+
+def test_default_path_is_private_to_the_app():
+    assert os.path.dirname(RESULT_CACHE_PATH).endswith(os.path.join(".survey_cache", "results"))
+
+
+def test_directory_is_created_private(tmp_path):
+    cache = DiskCache(str(tmp_path / "results" / "results.sqlite"))
+    cache.put("key", [1, 2])
+    assert cache.get("key") == [1, 2]
+    assert stat.S_IMODE(os.stat(tmp_path / "results").st_mode) == 0o700
+
+
+def test_directory_writable_by_others_is_not_used(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+    cache = DiskCache(str(directory / "results.sqlite"))
+    cache.put("key", [1, 2])
+    assert cache.get("key") is None
+    assert os.listdir(directory) == []
+
+
+def test_unusable_path_is_a_miss(tmp_path):
+    (tmp_path / "file").write_text("")
+    cache = DiskCache(str(tmp_path / "file" / "results.sqlite"))
+    cache.put("key", [1, 2])
+    assert cache.get("key", "default") == "default"
+
+
+def test_read_only_database_still_serves_hits(tmp_path):
+    cache = DiskCache(str(tmp_path / "results.sqlite"))
+    cache.put("good", [1, 2])
+    cache.put("bad", None)
+    conn = cache._connect()
+    conn.execute("UPDATE results SET value = ? WHERE key = ?", (b"not a pickle", cache._key("bad")))
+    conn.execute("PRAGMA query_only = ON")
+    assert cache.get("good") == [1, 2]
+    assert cache.get("bad", "default") == "default"
+
+
+def test_lru_bounds_the_bytes_it_keeps():
+    cache = LRUCache(maxsize=8, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.get("a")
+    cache.put("c", b"1234")  # 12 bytes: the least recently used, "b", goes
+    assert cache.get("b") is None and cache.get("a") == b"1234" and cache.get("c") == b"1234"
+    assert cache.bytes == 8
+    cache.put("a", b"12")  # replaced: counted once
+    assert cache.bytes == 6
+    cache.put("big", b"x" * 11)  # larger than the whole budget: not kept, nothing evicted
+    assert cache.get("big") is None and len(cache) == 2 and cache.bytes == 6
+
+
+def test_entries_expire_after_the_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: now[0]))
+    cache = DiskCache(str(tmp_path / "results.sqlite"), ttl=60)
+    cache.put("key", [1, 2])
+    now[0] += 59
+    assert cache.get("key") == [1, 2]
+    now[0] += 2
+    assert cache.get("key", "expired") == "expired"
+    cache.put("other", 1)  # the next write drops expired rows
+    assert cache.stats()["size"] == 1 and cache.evictions == 1
+
+
+def test_least_recently_read_entries_are_evicted_past_max_bytes(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: now[0]))
+    payload = b"x" * 1000
+    size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    cache = DiskCache(str(tmp_path / "results.sqlite"), max_bytes=3 * size)
+    for key in "abc":
+        now[0] += 1
+        cache.put(key, payload)
+    now[0] += 1
+    assert cache.get("a") == payload  # read: "b" is now the least recently read
+    now[0] += 1
+    cache.put("d", payload)
+    assert cache.get("b") is None
+    assert all(cache.get(key) == payload for key in "acd")
+    assert cache.stats()["bytes"] == 3 * size
+    cache.put("huge", b"x" * (3 * size))  # larger than the whole budget: not stored
+    assert cache.get("huge") is None and cache.get("a") == payload
@@ -0,0 +1,39 @@
+import numpy as np
+
+from dashboard_core import GPA_POINTS, charts, open_survey
+
+
+def test_quartile_box_matches_the_rows():
+    survey = open_survey()
+    selection = {"Gender": ["Female"]}
+    fig = charts.quartile_box(survey.cube, "GPA", "University", GPA_POINTS, selection, y="GPA_Numeric")
+    box, outliers = fig.data
+    rows = survey.select(selection).frame
+    assert list(box.x) == sorted(rows["University"].unique())
+    for i, university in enumerate(box.x):
+        gpa = rows.loc[rows["University"] == university, "GPA_Numeric"].to_numpy()
+        q1, median, q3 = np.percentile(gpa, [25, 50, 75])
+        inside = gpa[(gpa >= q1 - 1.5 * (q3 - q1)) & (gpa <= q3 + 1.5 * (q3 - q1))]
+        assert (box.q1[i], box.median[i], box.q3[i]) == (q1, median, q3)
+        assert (box.lowerfence[i], box.upperfence[i]) == (inside.min(), inside.max())
+        shown = sorted(y for x, y in zip(outliers.x, outliers.y) if x == university)
+        assert shown == sorted(set(gpa) - set(inside))
+    assert fig.layout.yaxis.title.text == "GPA_Numeric"
+
+
+def test_animation_frames_hold_every_bar_with_the_row_counts():
+    survey = open_survey()
+    selection = {"University": ["Gazi University"]}  # two (year, gender) pairs without students
+    fig = charts.animated_count_bar(survey.cube, "Gender", "Year of Study", "Gender", selection)
+    rows = survey.select(selection).frame
+    expected = rows.groupby(["Year of Study", "Gender"], observed=True).size()
+    years = sorted(rows["Year of Study"].unique())
+    genders = sorted(rows["Gender"].unique())
+    assert sorted(frame.name for frame in fig.frames) == years
+    for frame in fig.frames:
+        bars = {trace.name: dict(zip(trace.x, trace.y)) for trace in frame.data}
+        assert sorted(bars) == genders
+        for gender in genders:
+            # every bar in every frame, zero where no one answered
+            assert bars[gender] == {gender: expected.get((frame.name, gender), 0)}
+    assert fig.layout.yaxis.range[1] >= expected.max()
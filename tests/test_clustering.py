@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from dashboard_core import load_survey, open_survey
+from dashboard_core.cache import LRUCache
+from dashboard_core.clustering import (K_RANGE, cluster_view, clustering_features, distinct_points, fit_clusters,
+                                       fit_clusters_weighted)
+
+
+def tiled(n_rows, seed=0):
+    base = load_survey()
+    return base.take(np.random.default_rng(seed).integers(0, len(base), n_rows)).reset_index(drop=True)
+
+
+def test_full_engine_is_the_original_kmeans():
+    frame = load_survey()
+    X = StandardScaler().fit_transform(clustering_features(frame))
+    expected = KMeans(n_clusters=3, random_state=42).fit_predict(X)
+    assert (fit_clusters(frame).data["Cluster"].to_numpy() == expected).all()
+
+
+@pytest.mark.parametrize("n_rows", [None, 10_000, 100_000])
+@pytest.mark.parametrize("k", list(K_RANGE))
+def test_weighted_engine_fits_the_rows(n_rows, k):
+    frame = load_survey() if n_rows is None else tiled(n_rows)
+    weighted = fit_clusters_weighted(frame, k)
+    scaler = StandardScaler().fit(clustering_features(frame))
+    X = scaler.transform(clustering_features(frame))
+    centers = scaler.transform(pd.DataFrame(weighted.centers, columns=["GPA_Numeric", "AI_Knowledge"]))
+    distances = ((X[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    labels = weighted.data["Cluster"].to_numpy()
+    # a converged Lloyd fit of the rows: each row at a nearest center, the inertia theirs
+    assert (distances[np.arange(len(X)), labels] <= distances.min(axis=1) + 1e-9).all()
+    assert weighted.inertia == pytest.approx(distances[np.arange(len(X)), labels].sum())
+    assert weighted.inertia <= 1.01 * fit_clusters(frame, k).inertia
+
+
+@pytest.mark.parametrize("engine", ["full", "weighted"])
+def test_distinct_points_bound_the_clusters(engine):
+    survey = open_survey()
+    view = survey.select({"University": ["Gazi University"], "Year of Study": ["3"]})
+    n = distinct_points(view, cache=LRUCache())
+    assert n < len(view) < max(K_RANGE)
+    result = cluster_view(view, n_clusters=n, engine=engine, cache=LRUCache())
+    assert result.data["Cluster"].nunique() == n
+    assert distinct_points(survey.select({"University": ["Middle East Technical University"],
+                                          "Year of Study": ["4+"]}), cache=LRUCache()) == 1
+
+
+def test_warm_up_covers_the_sklearn_modules_of_the_section():
+    import ast
+    import inspect
+
+    from dashboard_core import clustering
+    from dashboard_core.warmup import SECTION_MODULES
+
+    imported = {node.module for node in ast.walk(ast.parse(inspect.getsource(clustering)))
+                if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("sklearn")}
+    assert imported <= set(SECTION_MODULES["clustering"])
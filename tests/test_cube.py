@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard_core import SurveyCube, load_survey
+from dashboard_core.cube import AI_COLUMN
+
+SELECTIONS = [None, {"Gender": ["Female"]}, {"University": ["Gazi University", "Hacettepe University"],
+                                              "Year of Study": ["1", "3"]}]
+
+
+def selected(frame, selection):
+    mask = np.ones(len(frame), dtype=bool)
+    for col, values in (selection or {}).items():
+        mask &= frame[col].isin(values).to_numpy()
+    return frame[mask]
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+@pytest.mark.parametrize("by", [["University"], ["Year of Study", "Gender"], [AI_COLUMN],
+                                ["Gender", "Concern Level"]])
+def test_counts_match_groupby(by, selection):
+    frame = load_survey()
+    counts = SurveyCube.from_frame(frame).counts(by, selection)
+    expected = selected(frame, selection).astype({c: str for c in by}).groupby(by).size()
+    got = counts.astype({c: str for c in by}).set_index(by)["count"]
+    pd.testing.assert_series_equal(got.sort_index(), expected[expected > 0].sort_index(), check_names=False)
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_rollup_means_and_kpis_match_the_rows(selection):
+    frame = load_survey()
+    cube = SurveyCube.from_frame(frame)
+    rows = selected(frame, selection)
+    means = cube.rollup(["University"], selection).set_index("University")["gpa_mean"]
+    expected = rows.groupby("University", observed=True)["GPA_Numeric"].mean()
+    pd.testing.assert_series_equal(means.sort_index(), expected.astype(np.float64).sort_index(), check_names=False,
+                                   check_index_type=False, check_categorical=False)
+    assert cube.kpis(selection) == {
+        "students": len(rows),
+        "universities": rows["University"].nunique(),
+        "gpa": round(float(rows["GPA_Numeric"].astype(np.float64).mean()), 2),
+        "ai": rows[AI_COLUMN].mode()[0],
+    }
+
+
+def test_merged_halves_are_the_whole():
+    frame = load_survey()
+    half = len(frame) // 2
+    merged = SurveyCube.from_frame(frame.iloc[:half]).merge(SurveyCube.from_frame(frame.iloc[half:]))
+    whole = SurveyCube.from_frame(frame)
+    for by in (["University", "Gender"], ["Year of Study", AI_COLUMN]):
+        pd.testing.assert_frame_equal(merged.counts(by).astype({c: str for c in by}),
+                                      whole.counts(by).astype({c: str for c in by}))
+    assert merged.kpis() == whole.kpis()
@@ -0,0 +1,115 @@
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard_core import dataset, load_survey, store
+from dashboard_core.cache import LRUCache
+from dashboard_core.cube import AI_COLUMN
+
+
+@pytest.fixture
+def survey_dataset(tmp_path, tmp_path_factory, monkeypatch):
+    monkeypatch.setattr(store, "cube_cache", LRUCache(maxsize=0))
+    monkeypatch.setattr(dataset, "PARTITION_CACHE_DIR", str(tmp_path_factory.mktemp("partition-cache")))
+    frame = load_survey()
+    dataset.write_partitioned(frame, str(tmp_path))
+    dataset.write_partitioned(frame, str(tmp_path), fmt="parquet", part="part-1")
+    return dataset.SurveyDataset(str(tmp_path), cache=LRUCache(maxsize=0))
+
+
+def test_large_selection_aggregates_without_concatenating(survey_dataset, monkeypatch):
+    ds = survey_dataset
+    selection = {"University": ds.values("University")[:3]}
+    in_memory = ds.load(selection)
+    monkeypatch.setattr(dataset, "AGGREGATE_THRESHOLD", 0)
+    chunked = ds.load(selection)
+
+    cube = chunked.cube
+    assert "frame" not in chunked.__dict__
+    for sel in [None, selection, {"Gender": ["Female"]}, {"Year of Study": ds.values("Year of Study")[:1]}]:
+        assert cube.kpis(sel) == in_memory.cube.kpis(sel)
+    pd.testing.assert_frame_equal(cube.counts(["Gender", AI_COLUMN]), in_memory.cube.counts(["Gender", AI_COLUMN]))
+    assert len(chunked) == len(in_memory) == cube.kpis()["students"]
+
+
+def test_out_of_core_view_reads_only_its_rows(survey_dataset, monkeypatch):
+    ds = survey_dataset
+    partitions = {"University": ds.values("University")[:3]}
+    in_memory = ds.load(partitions)
+    selection = {**partitions, "Gender": ["Female"], "Year of Study": ds.values("Year of Study")}
+    expected = in_memory.select(selection)
+    monkeypatch.setattr(dataset, "AGGREGATE_THRESHOLD", 0)
+    survey = ds.load(partitions)
+
+    assert set(survey.values("Gender")) == set(in_memory.values("Gender"))
+    view = survey.select(selection)
+    assert len(view) == len(expected)
+    assert "source" not in view.__dict__ and "frame" not in survey.__dict__
+    assert survey.select(selection) is view
+    columns = list(expected.frame.columns)
+    got = view.frame[columns].astype(str).sort_values(columns).reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, expected.frame.astype(str).sort_values(columns).reset_index(drop=True))
+
+
+APP = """
+from dashboard_core import layout
+source = layout.data_source("unused.csv")
+survey, selection, view = layout.sidebar_filters(source)
+layout.kpi_row(survey, selection)
+"""
+
+
+def test_app_path_stays_under_the_frame_size(tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])  # AppTest replaces it
+    monkeypatch.setattr(store, "cube_cache", LRUCache(maxsize=0))
+    monkeypatch.setattr(dataset, "AGGREGATE_THRESHOLD", 0)
+    base = load_survey()
+    frame = base.iloc[np.arange(400_000) % len(base)].reset_index(drop=True)
+    dataset.write_partitioned(frame, str(tmp_path), fmt="parquet")
+    monkeypatch.setenv("SURVEY_DATA", str(tmp_path))
+
+    AppTest.from_string(APP, default_timeout=120).run()  # imports, not measured
+    dataset.dataset_cache.clear()
+    at = AppTest.from_string(APP, default_timeout=120)
+    tracemalloc.start()
+    try:
+        at.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert not at.exception
+    assert at.metric[0].value == f"{len(frame)}"
+    assert peak < 0.75 * frame.memory_usage(deep=True).sum()
+    stores = list(dataset.dataset_cache._data.values())
+    dataset.dataset_cache.clear()
+    assert stores and not any("frame" in survey.__dict__ for survey in stores)
+
+
+def test_partition_caches_stay_out_of_the_data_tree(survey_dataset):
+    ds = survey_dataset
+    ds.load({}).frame
+    assert not [d for d, _, _ in os.walk(ds.root) if os.path.basename(d) == store.CACHE_DIR]
+    cached = [f for _, _, files in os.walk(dataset.PARTITION_CACHE_DIR) for f in files]
+    assert len(cached) == len(ds.files({})) // 2  # one per CSV file, none for parquet
+
+
+def test_open_dataset_rescans_only_changed_trees(survey_dataset, monkeypatch):
+    root = survey_dataset.root
+    scans = []
+    scan = dataset._scan
+    monkeypatch.setattr(dataset, "_scan", lambda path: scans.append(path) or scan(path))
+    monkeypatch.setattr(dataset, "_datasets", {})
+    ds = dataset.open_dataset(root)
+    assert dataset.open_dataset(root) is ds and len(scans) == 1
+
+    frame = load_survey().head(10).assign(University="Yeni Üniversite")
+    dataset.write_partitioned(frame, root)
+    ds2 = dataset.open_dataset(root)
+    assert ds2 is not ds and len(scans) == 2
+    assert "Yeni Üniversite" in ds2.values("University")
@@ -0,0 +1,82 @@
+import io
+
+import pandas as pd
+import pytest
+
+from dashboard_core import export, load_survey, open_survey
+from dashboard_core.export import EXTRA_GLYPHS, MAX_COL_CHARS, pdf_bytes
+
+
+def pdf_pages(data):
+    pypdf = pytest.importorskip("pypdf")
+    return [page.extract_text() for page in pypdf.PdfReader(io.BytesIO(data)).pages]
+
+
+def pdf_text(data):
+    return "".join(pdf_pages(data))
+
+
+def test_pdf_keeps_turkish_letters():
+    frame = pd.DataFrame({"University": ["Boğaziçi", "İstanbul Teknik", "Çukurova"],
+                          "Note": ["Şişli – “AI”", "ıĞğ", "Kraków, Łódź"]})
+    text = pdf_text(pdf_bytes(frame, title="Öğrenci görüşleri"))
+    for value in ["Boğaziçi", "İstanbul Teknik", "Çukurova", "Şişli – “AI”", "ıĞğ", "Kraków, Łódź",
+                  "Öğrenci görüşleri"]:
+        assert value in text
+
+
+def test_pdf_replaces_characters_outside_the_encoding():
+    frame = pd.DataFrame({"University": ["東京", "Αθήνα", "\x85"]})
+    text = pdf_text(pdf_bytes(frame))
+    assert "??" in text and "?????" in text
+    assert "東" not in text and "Α" not in text
+
+
+def test_extra_glyphs_fill_the_unused_winansi_codes():
+    assert len(EXTRA_GLYPHS) == 0xA0 - 0x80
+    assert len({char for char, _ in EXTRA_GLYPHS}) == len(EXTRA_GLYPHS)
+
+
+def test_pdf_keeps_every_value_of_every_column():
+    frame = load_survey().head(200)
+    pages = pdf_pages(pdf_bytes(frame))
+    text = "\n".join(pages)
+    for col in frame.columns:
+        assert all(word in text for word in col.split())
+        for value in frame[col].astype(str).unique():
+            assert value in text, (col, value)
+    # the columns that do not fit continue on the next page, for the same rows
+    assert len(pages) % 2 == 0 and len(pages) > 2
+    assert pages[0].startswith("Gender") and "GPA_Numeric" not in pages[0]
+    assert "GPA_Numeric" in pages[1] and "Gender" not in pages[1]
+
+
+def test_pdf_wraps_long_values():
+    long = " ".join(f"word{i}" for i in range(3 * MAX_COL_CHARS // 5))
+    frame = pd.DataFrame({"Comment": [long, "short"], "University": ["Hacettepe Üniversitesi", "ODTÜ"]})
+    lines = pdf_text(pdf_bytes(frame)).splitlines()
+    assert max(map(len, lines)) < len(long)
+    words = " ".join(lines).split()
+    assert [w for w in words if w.startswith("word")] == long.split()
+    assert "Hacettepe Üniversitesi" in "\n".join(lines)
+
+
+class RecordingCache:
+    def __init__(self):
+        self.puts = []
+
+    def get(self, key, default=None):
+        return default
+
+    def put(self, key, value):
+        self.puts.append(key)
+
+
+def test_files_above_the_limit_are_not_cached(monkeypatch):
+    view = open_survey().select({})
+    cache = RecordingCache()
+    csv = export.view_export(view, "csv", cache)
+    assert cache.puts == [(view.key, "csv")]
+    monkeypatch.setattr(export, "EXPORT_CACHE_MAX_FILE", len(csv) - 1)
+    assert export.view_export(view, "csv", cache) == csv
+    assert len(cache.puts) == 1
@@ -0,0 +1,33 @@
+from dashboard_core import charts, figures, open_survey
+from dashboard_core.cache import LRUCache
+
+
+def test_charts_differing_only_in_positional_columns_are_cached_apart():
+    survey = open_survey()
+    selection = {}
+    key = figures.data_key(survey.select(selection), selection)
+    caches = dict(traces=LRUCache(), figures=LRUCache())
+    by_year = figures.cached_figure(key, charts.count_bar, survey.cube, "Year of Study", "University", selection,
+                                    **caches)
+    by_gender = figures.cached_figure(key, charts.count_bar, survey.cube, "AI and Automation Knowledge Level", "Gender",
+                                      selection, **caches)
+    assert by_year.layout.xaxis.title.text == "Year of Study"
+    assert by_year._chart_name == "count_bar Year of Study University"
+    assert by_gender.layout.xaxis.title.text == "AI and Automation Knowledge Level"
+    assert {trace.name for trace in by_gender.data} == set(survey.index.values("Gender"))
+
+
+def test_view_frame_is_materialized_only_on_a_miss():
+    survey = open_survey()
+    selection = {"Gender": survey.index.values("Gender")[:1]}
+    caches = dict(traces=LRUCache(), figures=LRUCache())
+    kwargs = dict(y="GPA_Numeric", x="Year of Study", color="Gender", box=True, **caches)
+    first = survey.select(selection)
+    key = figures.data_key(first, selection)
+    figures.cached_figure(key, charts.kde_violin, first, **kwargs)
+    assert "frame" in first.__dict__
+
+    second = survey.select(selection)
+    fig = figures.cached_figure(key, charts.kde_violin, second, template="plotly_dark", **kwargs)
+    assert "frame" not in second.__dict__
+    assert len(fig.data) == len(figures.cached_figure(key, charts.kde_violin, first, **kwargs).data)
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from dashboard_core import FILTER_COLUMNS, FilterIndex, SurveyCube
+
+
+def survey_with_missing():
+    frame = pd.DataFrame({
+        "University": ["METU", "METU", "Hacettepe", None, "Hacettepe"],
+        "Gender": ["Female", "Male", None, "Male", "Female"],
+        "Year of Study": ["1", "2", "3", "4", "1"],
+        "GPA": ["2.51 - 3.00"] * 5,
+        "AI and Automation Knowledge Level": ["High knowledge"] * 5,
+    }).astype("category")
+    frame["GPA_Numeric"] = np.float32(2.755)
+    return frame
+
+
+def test_selecting_every_value_excludes_missing_rows():
+    frame = survey_with_missing()
+    index = FilterIndex(frame)
+    selection = {col: index.values(col) for col in FILTER_COLUMNS}
+    view = index.select(selection)
+
+    expected = frame[np.logical_and.reduce([frame[c].isin(v) for c, v in selection.items()])]
+    assert list(view.rows) == list(expected.index)
+    assert len(view) == SurveyCube.from_frame(frame).kpis(selection)["students"] == 3
+
+
+def test_column_without_missing_values_is_skipped():
+    frame = survey_with_missing()
+    index = FilterIndex(frame)
+    assert index.mask({"Year of Study": index.values("Year of Study")}) is None
+
+
+def test_appended_missing_value_is_excluded():
+    frame = survey_with_missing()
+    index = FilterIndex(frame.iloc[[0, 1, 4]])
+    assert index.mask({"Gender": index.values("Gender")}) is None
+    index = index.extended(frame.iloc[[0, 1, 4, 2]].reset_index(drop=True))
+    view = index.select({"Gender": index.values("Gender")})
+    assert list(view.rows) == [0, 1, 2]
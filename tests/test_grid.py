@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from dashboard_core import grid, open_survey
+
+
+@pytest.fixture
+def view():
+    return open_survey().select({"Gender": ["Female"]})
+
+
+@pytest.mark.parametrize("size", [25, 50, len(open_survey()) + 1])
+def test_pages_cover_the_selection_once(view, size):
+    n = grid.n_pages(view, size)
+    assert n == max(1, -(-len(view) // size))
+    pages = [grid.page(view, i, size) for i in range(n)]
+    assert all(len(p) == size for p in pages[:-1]) and 0 < len(pages[-1]) <= size
+    pd.testing.assert_frame_equal(pd.concat(pages), view.frame)
+    assert grid.page(view, n, size).empty
+
+
+def test_sorted_pages_follow_the_sorted_rows(view):
+    column = "University"
+    pages = [grid.page(view, i, 50, columns=[column, "GPA"], sort_by=column, ascending=False)
+             for i in range(grid.n_pages(view, 50))]
+    shown = pd.concat(pages)
+    assert list(shown.columns) == [column, "GPA"]
+    assert shown[column].astype(str).tolist() == sorted(view.frame[column].astype(str), reverse=True)
+    assert sorted(shown.index) == sorted(view.frame.index)
+
+
+def test_empty_selection_has_one_empty_page():
+    view = open_survey().select({"Gender": []})
+    assert grid.n_pages(view, 25) == 1
+    assert grid.page(view, 0, 25).empty
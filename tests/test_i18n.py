@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+from dashboard_core.i18n import TRANSLATIONS, strings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_overrides_replace_only_their_keys():
+    t = strings("Español", {"Español": {"title": "Otro título"}, "English": {"title": "Other"}})
+    assert t == {**TRANSLATIONS["Español"], "title": "Otro título"}
+    assert strings("Español") == TRANSLATIONS["Español"]
+
+
+@pytest.mark.parametrize("lang, title, feedback", [
+    ("中文", "📊 安卡拉学生综合分析", "📝 提供您的反馈"),
+    ("Español", "📊 Análisis de estudiantes en Ankara", "📝 Comparte tu opinión"),
+    ("English", "📊 Comprehensive Student Analysis in Ankara", "📝 Share your feedback"),
+])
+def test_multilang_base_keeps_its_own_wording(lang, title, feedback, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setitem(sys.modules, "__main__", sys.modules["__main__"])  # AppTest replaces it
+    monkeypatch.chdir(ROOT)
+    at = AppTest.from_file(os.path.join(ROOT, "app_multilang_base.py"), default_timeout=60).run()
+    at.sidebar.selectbox[0].select(lang).run()
+    assert not at.exception
+    assert at.title[0].value == title
+    assert [s.value for s in at.subheader][-3:-1] == ["📤 Export", feedback]
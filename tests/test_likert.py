@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from dashboard_core import LIKERT_SCHEMA, encode_likert, load_survey
+from dashboard_core.likert import MISSING
+
+
+def decode(likert):
+    """The answers back from their codes; ``None`` for ``MISSING``."""
+    return pd.DataFrame({col: np.array(LIKERT_SCHEMA[col] + [None], dtype=object)[likert.column(col)]
+                         for col in likert.columns}, dtype=object)
+
+
+def test_codes_decode_to_the_answers():
+    frame = load_survey()
+    likert = encode_likert(frame)
+    assert likert.columns == [col for col in LIKERT_SCHEMA if col in frame.columns]
+    assert likert.codes.dtype == np.int8
+    pd.testing.assert_frame_equal(decode(likert), frame[likert.columns].astype(object))
+
+
+def test_missing_and_unknown_answers_are_missing():
+    frame = pd.DataFrame({"Concern Level": ["Highly concerned", None, "Very concerned", "Not concerned"]})
+    codes = encode_likert(frame).column("Concern Level")
+    assert list(codes) == [3, MISSING, MISSING, 0]
+    decoded = decode(encode_likert(frame))["Concern Level"]
+    assert decoded.isna().tolist() == [False, True, True, False]
+    assert decoded.dropna().tolist() == ["Highly concerned", "Not concerned"]
+
+
+def test_extended_matrix_is_the_encoded_concatenation():
+    frame = load_survey()
+    half = len(frame) // 2
+    extended = encode_likert(frame.iloc[:half]).extended(frame.iloc[half:])
+    assert (extended.codes == encode_likert(frame).codes).all()
+    rows = np.array([5, 0, 42])
+    assert (encode_likert(frame).take(rows).codes == encode_likert(frame.iloc[rows]).codes).all()
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+import types
+
+from dashboard_core import SurveyCube, load_survey, parallel
+
+
+def test_build_cube_matches_and_removes_its_buffers(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    frame = load_survey()
+    for workers in (1, 2):
+        cube = parallel.build_cube(frame, workers=workers, shards=3)
+        assert cube.kpis() == SurveyCube.from_frame(frame).kpis()
+    assert os.listdir(tmp_path) == []
+
+
+def test_workers_do_not_run_the_app_script(tmp_path, monkeypatch):
+    # Streamlit installs the app script as __main__; a spawned worker would run it again
+    script = tmp_path / "app.py"
+    script.write_text(f"open({str(tmp_path / 'ran')!r}, 'w').close()\n")
+    app = types.ModuleType("__main__")
+    app.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", app)
+    monkeypatch.setattr(parallel, "_pool", None)
+    frame = load_survey()
+    cube = parallel.build_cube(frame, workers=2, shards=2)
+    assert cube.kpis() == SurveyCube.from_frame(frame).kpis()
+    assert sys.modules["__main__"] is app
+    assert not (tmp_path / "ran").exists()
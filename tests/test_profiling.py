@@ -0,0 +1,31 @@
+import threading
+import tracemalloc
+
+from dashboard_core import profiling
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        profiling.start_run("app", trace_memory=False)
+        assert tracemalloc.is_tracing()
+        profiling.start_run("app", trace_memory=True)
+        profiling.stop_run()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_tracing_stops_once_no_run_asks_for_it():
+    first = profiling.start_run("a", trace_memory=True)
+    assert tracemalloc.is_tracing()
+
+    # another session's rerun, in its own thread, without tracing
+    other = threading.Thread(target=profiling.start_run, args=("b",), kwargs={"trace_memory": False})
+    other.start()
+    other.join()
+    assert tracemalloc.is_tracing()
+
+    profiling.start_run("a", trace_memory=False, previous=first)
+    assert not tracemalloc.is_tracing()
+    profiling.stop_run()
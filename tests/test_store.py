@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pytest
+
+from dashboard_core import load_survey, store
+from dashboard_core.cache import LRUCache
+
+
+@pytest.fixture
+def survey_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "cube_cache", LRUCache(maxsize=0))
+    monkeypatch.setattr(store, "_stores", {})
+    base = load_survey().drop(columns="GPA_Numeric").astype(str)
+    # larger than the append window, so an edit near the top lies outside it
+    frame = base.iloc[np.arange(5000) % len(base)].reset_index(drop=True)
+    path = tmp_path / "survey.csv"
+    frame.to_csv(path, index=False)
+    return str(path), frame
+
+
+def rewrite(path, frame):
+    before = os.stat(path)
+    frame.to_csv(path, index=False)
+    # a later mtime even on filesystems with a coarse clock
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns + 10**9))
+
+
+def year_counts(survey):
+    return survey.frame["Year of Study"].astype(str).value_counts().to_dict()
+
+
+def reopen(path, cache_dir):
+    """The store seen by the running process, and by a new one reading the same Arrow cache."""
+    running = store.open_survey(path, cache_dir)
+    store._stores.clear()
+    return running, store.open_survey(path, cache_dir)
+
+
+def test_appended_rows_are_added(survey_csv, tmp_path):
+    path, frame = survey_csv
+    cache_dir = str(tmp_path / "cache")
+    before = store.open_survey(path, cache_dir)
+    store.append_responses(frame.head(5), path)
+    for survey in reopen(path, cache_dir):
+        assert len(survey) == len(before) + 5
+        assert survey.offset == os.path.getsize(path)
+        assert year_counts(survey) == year_counts(store.read_survey(path, str(tmp_path / "fresh")))
+
+
+def test_edit_keeping_the_size_is_reparsed(survey_csv, tmp_path):
+    path, frame = survey_csv
+    cache_dir = str(tmp_path / "cache")
+    store.open_survey(path, cache_dir)
+    edited = frame.copy()
+    old = edited.loc[0, "Year of Study"]
+    edited.loc[0, "Year of Study"] = next(v for v in edited["Year of Study"].unique() if len(v) == len(old) and v != old)
+    size = os.path.getsize(path)
+    rewrite(path, edited)
+    assert os.path.getsize(path) == size
+    for survey in reopen(path, cache_dir):
+        assert year_counts(survey) == edited["Year of Study"].value_counts().to_dict()
+
+
+def test_truncated_file_is_reparsed(survey_csv, tmp_path):
+    path, frame = survey_csv
+    cache_dir = str(tmp_path / "cache")
+    store.open_survey(path, cache_dir)
+    rewrite(path, frame.head(10))
+    for survey in reopen(path, cache_dir):
+        assert len(survey) == 10
+        assert year_counts(survey) == frame.head(10)["Year of Study"].value_counts().to_dict()
+
+
+def test_unwritable_cache_directory_still_loads(survey_csv, tmp_path, caplog):
+    path, frame = survey_csv
+    (tmp_path / "file").write_text("")
+    cache_dir = str(tmp_path / "file" / "cache")
+    survey = store.open_survey(path, cache_dir)
+    assert len(survey) == len(frame)
+    assert "not written" in caplog.text
+    store.append_responses(frame.head(5), path)
+    assert len(store.open_survey(path, cache_dir)) == len(frame) + 5